@@ -4,36 +4,65 @@ Routes Controller for Vehicle Rental Application.
 Handles all HTTP routes and business logic for the web application.
 """
 
-from flask import render_template, request, redirect, url_for, session, flash
-from functools import wraps
+from flask import render_template, request, redirect, url_for, session, flash, g
+from collections import Counter
+from functools import lru_cache, wraps
 import sys
 import os
 
-# Add models to path
+# Add models to path (the model modules import each other flat)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'models'))
 
 from models.vehicle_rental import VehicleRental
-from models.individual_user import IndividualUser
-from models.corporate_user import CorporateUser
-from models.staff_user import StaffUser
-from models.car import Car
-from models.motorbike import Motorbike
-from models.truck import Truck
 from models.rental_period import RentalPeriod
 from datetime import datetime
 
+# User and vehicle subclasses are imported lazily inside the staff add
+# handlers; they are not needed for ordinary request handling
+
 # Initialize rental system
 rental_system = VehicleRental("data/rental_data.pkl")
 
 
+@lru_cache(maxsize=4096)
+def _parse_ddmmyyyy(date_str):
+    """Parse a DD-MM-YYYY date string to a datetime.
+
+    Memoized because the same stored dates are re-parsed across requests,
+    and strptime's format interpretation is comparatively expensive.
+    """
+    return datetime(int(date_str[6:10]), int(date_str[3:5]), int(date_str[0:2]))
+
+
+# Price-range query values mapped to Vehicle price bucket IDs
+_PRICE_BUCKETS = {'0-50': 0, '51-100': 1, '101+': 2}
+
+
 def init_routes(app):
     """Initialize all routes for the Flask application."""
-    
+
+    # Cache compiled Jinja templates unboundedly and skip mtime checks,
+    # so templates are compiled once instead of on every request
+    app.jinja_env.auto_reload = False
+    app.jinja_env.cache_size = -1
+
+    @app.before_request
+    def load_logged_in_user():
+        """Resolve session identity and the logged-in user once per request."""
+        g.user_id = session.get('user_id')
+        g.user_type = session.get('user_type')
+        g.user = rental_system._find_renter_by_id(g.user_id) if g.user_id else None
+
+    @app.teardown_request
+    def flush_rental_data(exception=None):
+        """Persist pending changes once per request instead of per mutation."""
+        rental_system.flush()
+
     # ============ Authentication Decorator ============
     def login_required(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if 'user_id' not in session:
+            if g.user_id is None:
                 flash('Please login first.', 'error')
                 return redirect(url_for('login'))
             return f(*args, **kwargs)
@@ -42,7 +71,7 @@ def init_routes(app):
     def staff_required(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if 'user_type' not in session or session['user_type'] != 'Staff':
+            if g.user_type != 'Staff':
                 flash('Access denied. Staff only.', 'error')
                 return redirect(url_for('dashboard'))
             return f(*args, **kwargs)
@@ -51,7 +80,7 @@ def init_routes(app):
     def non_staff_required(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if 'user_type' in session and session['user_type'] == 'Staff':
+            if g.user_type == 'Staff':
                 flash('Staff cannot rent or return vehicles.', 'error')
                 # Get the vehicle_id from kwargs if available
                 vehicle_id = kwargs.get('vehicle_id')
@@ -100,29 +129,26 @@ def init_routes(app):
     @login_required
     def dashboard():
         """Display role-specific dashboard."""
-        user_type = session.get('user_type')
-        user_id = session.get('user_id')
-        
-        # Get user object
-        user = rental_system._find_renter_by_id(user_id)
+        user_type = g.user_type
+        user_id = g.user_id
+
+        # User object already resolved by the before_request hook
+        user = g.user
         
         if user_type == 'Staff':
-            # Staff dashboard with analytics
-            vehicles = rental_system.get_vehicles()
-            users = rental_system.get_renters()
-            records = rental_system.get_rental_records()
-            active_records = rental_system.get_active_rental_records()
-            
+            # Staff dashboard with analytics (O(1) counters, no list copies)
+            vehicle_count, user_count, rental_count, active_count = rental_system.get_counts()
+
             return render_template('dashboard_staff.html',
                                  user=user,
-                                 vehicle_count=len(vehicles),
-                                 user_count=len(users),
-                                 rental_count=len(records),
-                                 active_count=len(active_records))
+                                 vehicle_count=vehicle_count,
+                                 user_count=user_count,
+                                 rental_count=rental_count,
+                                 active_count=active_count)
         else:
             # Individual/Corporate dashboard
             user_rentals = rental_system.get_rental_records_by_renter(user_id)
-            active_rentals = [r for r in user_rentals if r.is_active()]
+            active_rentals = rental_system.get_active_rental_records_by_renter(user_id)
             
             return render_template('dashboard_user.html',
                                  user=user,
@@ -139,26 +165,26 @@ def init_routes(app):
         brand = request.args.get('brand', '')
         price_range = request.args.get('price', '')
         
-        # Get all vehicles
-        all_vehicles = rental_system.get_vehicles()
-        
-        # Apply filters
-        filtered_vehicles = all_vehicles
-        
+        # Start from the pre-bucketed type index (or the full fleet) and
+        # apply the remaining filters in a single pass
         if vehicle_type:
-            filtered_vehicles = [v for v in filtered_vehicles if v.get_vehicle_type() == vehicle_type]
-        
-        if brand:
-            filtered_vehicles = [v for v in filtered_vehicles if brand.lower() in v.get_make().lower()]
-        
-        if price_range:
-            if price_range == '0-50':
-                filtered_vehicles = [v for v in filtered_vehicles if v.get_daily_rate() <= 50]
-            elif price_range == '51-100':
-                filtered_vehicles = [v for v in filtered_vehicles if 51 <= v.get_daily_rate() <= 100]
-            elif price_range == '101+':
-                filtered_vehicles = [v for v in filtered_vehicles if v.get_daily_rate() > 100]
-        
+            candidates = rental_system.get_vehicles_by_type(vehicle_type)
+        else:
+            candidates = rental_system.get_vehicles()
+
+        brand_lower = brand.lower()
+        price_bucket = _PRICE_BUCKETS.get(price_range)
+
+        if not brand_lower and price_bucket is None:
+            # Common no-filter case: skip the filtering pass entirely
+            filtered_vehicles = candidates
+        else:
+            filtered_vehicles = [
+                v for v in candidates
+                if (not brand_lower or brand_lower in v.get_make_lower())
+                and (price_bucket is None or v.get_price_bucket() == price_bucket)
+            ]
+
         return render_template('vehicles.html',
                              vehicles=filtered_vehicles,
                              current_type=vehicle_type,
@@ -195,12 +221,13 @@ def init_routes(app):
         if request.method == 'POST':
             start_date = request.form.get('start_date')
             end_date = request.form.get('end_date')
-            user_id = session.get('user_id')
+            user_id = g.user_id
             
             try:
-                # Convert dates to DD-MM-YYYY format
-                start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-                end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+                # Convert dates to DD-MM-YYYY format (fromisoformat skips
+                # strptime's format-string machinery)
+                start_dt = datetime.fromisoformat(start_date)
+                end_dt = datetime.fromisoformat(end_date)
                 start_formatted = start_dt.strftime('%d-%m-%Y')
                 end_formatted = end_dt.strftime('%d-%m-%Y')
                 
@@ -228,19 +255,11 @@ def init_routes(app):
     @login_required
     def rental_invoice(vehicle_id):
         """Display rental invoice."""
-        user_id = session.get('user_id')
-        user = rental_system._find_renter_by_id(user_id)
-        
-        # Get user's current rentals
-        user_rentals = user.get_current_rentals()
-        
-        # Find the rental for this vehicle
-        vehicle_rental = None
-        for rental in user_rentals:
-            if rental['vehicle_id'] == vehicle_id:
-                vehicle_rental = rental
-                break
-        
+        user = g.user
+
+        # Find the rental for this vehicle (keyed lookup on the user)
+        vehicle_rental = user.get_current_rental(vehicle_id)
+
         if not vehicle_rental:
             flash('No rental record found.', 'error')
             return redirect(url_for('dashboard'))
@@ -257,7 +276,7 @@ def init_routes(app):
     @non_staff_required
     def return_vehicle(vehicle_id):
         """Handle vehicle return with early/normal/overdue support."""
-        user_id = session.get('user_id')
+        user_id = g.user_id
 
         # Find active rental record
         active_record = None
@@ -279,7 +298,7 @@ def init_routes(app):
 
             try:
                 # Convert date format from YYYY-MM-DD to DD-MM-YYYY
-                return_dt = datetime.strptime(return_date, '%Y-%m-%d')
+                return_dt = datetime.fromisoformat(return_date)
                 return_formatted = return_dt.strftime('%d-%m-%Y')
 
                 # Process return using new method
@@ -300,9 +319,13 @@ def init_routes(app):
             except Exception as e:
                 flash(f'Error: {str(e)}', 'error')
 
-        # Calculate return context
+        # Calculate return context; prefer the datetime stored at rent time
         today = datetime.now()
-        scheduled_end = datetime.strptime(active_record.get_end_date(), '%d-%m-%Y')
+        current_rental = g.user.get_current_rental(vehicle_id) if g.user else None
+        if current_rental is not None and 'end_dt' in current_rental:
+            scheduled_end = current_rental['end_dt']
+        else:
+            scheduled_end = _parse_ddmmyyyy(active_record.get_end_date())
 
         return render_template('return_form.html',
                              vehicle=vehicle,
@@ -316,7 +339,7 @@ def init_routes(app):
     @login_required
     def rental_history():
         """Display user's rental history."""
-        user_id = session.get('user_id')
+        user_id = g.user_id
 
         # Get rental records from rental system (includes all return information)
         rental_records = rental_system.get_rental_records_by_renter(user_id)
@@ -338,6 +361,9 @@ def init_routes(app):
     def staff_add_user():
         """Add new user (staff only)."""
         if request.method == 'POST':
+            from models.individual_user import IndividualUser
+            from models.corporate_user import CorporateUser
+
             user_type = request.form.get('user_type')
             user_id = request.form.get('user_id')
             name = request.form.get('name')
@@ -372,20 +398,15 @@ def init_routes(app):
     def staff_delete_user(user_id):
         """Delete user (staff only)."""
         # Prevent self-deletion
-        if user_id == session.get('user_id'):
+        if user_id == g.user_id:
             flash('Cannot delete your own account.', 'error')
             return redirect(url_for('staff_users'))
         
-        users = rental_system.get_renters()
-        user_to_delete = None
-        for user in users:
-            if user.get_renter_id() == user_id:
-                user_to_delete = user
-                break
-        
+        user_to_delete = rental_system._find_renter_by_id(user_id)
+
         if user_to_delete:
             rental_system._VehicleRental__renters.remove(user_to_delete)
-            rental_system.save_data()
+            rental_system.mark_dirty()
             flash('User deleted successfully.', 'success')
         else:
             flash('User not found.', 'error')
@@ -406,6 +427,10 @@ def init_routes(app):
     def staff_add_vehicle():
         """Add new vehicle (staff only)."""
         if request.method == 'POST':
+            from models.car import Car
+            from models.motorbike import Motorbike
+            from models.truck import Truck
+
             vehicle_type = request.form.get('vehicle_type')
             vehicle_id = request.form.get('vehicle_id')
             make = request.form.get('make')
@@ -454,7 +479,7 @@ def init_routes(app):
                 flash('Cannot delete vehicle. It is currently rented.', 'error')
             else:
                 rental_system._VehicleRental__vehicles.remove(vehicle)
-                rental_system.save_data()
+                rental_system.mark_dirty()
                 flash('Vehicle deleted successfully.', 'success')
         else:
             flash('Vehicle not found.', 'error')
@@ -470,8 +495,8 @@ def init_routes(app):
         records = rental_system.get_rental_records()
         users = rental_system.get_renters()
 
-        # Calculate statistics
-        vehicle_rental_counts = {}
+        # Calculate statistics (single pass over the records)
+        vehicle_rental_counts = Counter()
         vehicle_revenue = {}
         total_revenue = 0
         total_days = 0
@@ -485,23 +510,28 @@ def init_routes(app):
         revenue_by_user_type = {'Individual': 0, 'Corporate': 0, 'Staff': 0}
         rentals_by_user_type = {'Individual': 0, 'Corporate': 0, 'Staff': 0}
 
+        # Hoist bound lookups out of the hot loop
+        find_vehicle = rental_system._find_vehicle_by_id
+        find_renter = rental_system._find_renter_by_id
+
         for record in records:
             vid = record.get_vehicle_id()
-            vehicle = rental_system._find_vehicle_by_id(vid)
-            user = rental_system._find_renter_by_id(record.get_renter_id())
 
             # Count rentals per vehicle
-            vehicle_rental_counts[vid] = vehicle_rental_counts.get(vid, 0) + 1
+            vehicle_rental_counts[vid] += 1
 
             if record.is_completed():
+                # Vehicle/user objects are only needed for completed records
+                vehicle = find_vehicle(vid)
+                user = find_renter(record.get_renter_id())
+
                 # Use final cost if available (after return), otherwise use rental cost
-                cost = record.get_final_cost() if record.get_final_cost() else record.get_rental_cost()
+                final_cost = record.get_final_cost()
+                cost = final_cost if final_cost else record.get_rental_cost()
                 total_revenue += cost
 
                 # Track revenue per vehicle
-                if vid not in vehicle_revenue:
-                    vehicle_revenue[vid] = 0
-                vehicle_revenue[vid] += cost
+                vehicle_revenue[vid] = vehicle_revenue.get(vid, 0) + cost
 
                 # Use actual duration if available, otherwise use scheduled duration
                 if record.get_actual_return_date():
@@ -529,24 +559,25 @@ def init_routes(app):
         # Calculate average rental duration
         avg_days = total_days / completed_rentals if completed_rentals > 0 else 0
 
+        # Rank vehicles by rental count once; reuse for top/bottom 5 and most/least
+        ranked_by_count = vehicle_rental_counts.most_common()
+
         # Top 5 most rented vehicles
-        top_5_rented = sorted(vehicle_rental_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        top_5_vehicles = [(rental_system._find_vehicle_by_id(vid), count) for vid, count in top_5_rented]
+        top_5_vehicles = [(rental_system._find_vehicle_by_id(vid), count)
+                          for vid, count in ranked_by_count[:5]]
 
         # Bottom 5 least rented vehicles
-        bottom_5_rented = sorted(vehicle_rental_counts.items(), key=lambda x: x[1])[:5]
-        bottom_5_vehicles = [(rental_system._find_vehicle_by_id(vid), count) for vid, count in bottom_5_rented]
+        bottom_5_vehicles = [(rental_system._find_vehicle_by_id(vid), count)
+                             for vid, count in ranked_by_count[:-6:-1]]
 
         # Top 5 revenue generating vehicles
         top_5_revenue = sorted(vehicle_revenue.items(), key=lambda x: x[1], reverse=True)[:5]
         top_5_revenue_vehicles = [(rental_system._find_vehicle_by_id(vid), revenue) for vid, revenue in top_5_revenue]
 
         # Most/least rented (overall)
-        if vehicle_rental_counts:
-            most_rented_id = max(vehicle_rental_counts, key=vehicle_rental_counts.get)
-            least_rented_id = min(vehicle_rental_counts, key=vehicle_rental_counts.get)
-            most_rented = rental_system._find_vehicle_by_id(most_rented_id)
-            least_rented = rental_system._find_vehicle_by_id(least_rented_id)
+        if ranked_by_count:
+            most_rented = rental_system._find_vehicle_by_id(ranked_by_count[0][0])
+            least_rented = rental_system._find_vehicle_by_id(ranked_by_count[-1][0])
         else:
             most_rented = least_rented = None
 
@@ -574,5 +605,5 @@ def init_routes(app):
     @staff_required
     def staff_history():
         """Display all rental history (staff only)."""
-        records = rental_system.get_rental_records()
+        records = rental_system.get_rental_table_rows()
         return render_template('staff_history.html', records=records)
\ No newline at end of file
@@ -4,14 +4,25 @@ Routes Controller for Vehicle Rental Application.
 Handles all HTTP routes and business logic for the web application.
 """
 
-from flask import render_template, request, redirect, url_for, session, flash
-from functools import wraps
+from flask import render_template, request, redirect, url_for, session, flash, g, stream_template
+from collections import Counter
+from functools import lru_cache, wraps
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.utils import secure_filename
+import hashlib
+import heapq
+import json
 import sys
 import os
+import tempfile
 
-# Add models to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'models'))
+# The model modules import each other flat (e.g. "from vehicle import Vehicle"),
+# so the models directory has to stay on sys.path; guard the insert so reloads
+# and repeated imports don't keep prepending duplicate entries that every
+# subsequent import statement then has to walk.
+_MODELS_DIR = os.path.join(os.path.dirname(__file__), '..', 'models')
+if _MODELS_DIR not in sys.path:
+    sys.path.insert(0, _MODELS_DIR)
 
 from models.vehicle_rental import VehicleRental
 from models.individual_user import IndividualUser
@@ -21,99 +32,182 @@ from models.car import Car
 from models.motorbike import Motorbike
 from models.truck import Truck
 from models.rental_period import RentalPeriod
-from datetime import datetime
+from datetime import date, datetime
 
 # Initialize rental system
 rental_system = VehicleRental("data/rental_data.pkl")
 
 
-def init_routes(app):
-    """Initialize all routes for the Flask application."""
+# ============ Custom Jinja2 Filters ============
+@lru_cache(maxsize=8192)
+def _reformat_datetime(date_string):
+    """Parse a "YYYY-MM-DD HH:MM:SS" string and memoize the DD-MM-YYYY result."""
+    try:
+        # Check if it's a full datetime string (YYYY-MM-DD HH:MM:SS)
+        if len(date_string) > 10 and ' ' in date_string:
+            # Parse the date part on the C fast path and rebuild as DD-MM-YYYY
+            d = date.fromisoformat(date_string[:10])
+            return f"{d.day:02d}-{d.month:02d}-{d.year}"
+        else:
+            return date_string
+    except ValueError:
+        # If parsing fails, return original string
+        return date_string
 
-    # ============ Custom Jinja2 Filters ============
-    def format_datetime(date_string):
-        """
-        Format datetime string to uniform display format: DD-MM-YYYY
 
-        Handles two input formats:
-        - "YYYY-MM-DD HH:MM:SS" (from created_at)
-        - "DD-MM-YYYY" (from start_date, end_date, actual_return_date)
-        """
-        if not date_string:
-            return "N/A"
+def format_datetime(date_string):
+    """
+    Format datetime string to uniform display format: DD-MM-YYYY
+
+    Handles two input formats:
+    - "YYYY-MM-DD HH:MM:SS" (from created_at)
+    - "DD-MM-YYYY" (from start_date, end_date, actual_return_date)
+
+    Dates repeat heavily across history/analytics tables, so the parsing
+    branch is memoized; the common DD-MM-YYYY input returns before the
+    cache is even consulted.
+    """
+    if not date_string:
+        return "N/A"
+
+    # Fast path: already in "DD-MM-YYYY" format
+    if len(date_string) == 10 and date_string[2] == '-':
+        return date_string
+
+    return _reformat_datetime(date_string)
+
+
+# Price-range filter predicates, resolved once at import instead of an
+# if/elif chain per listing request
+PRICE_PREDS = {
+    '0-50':   lambda rate: rate <= 50,
+    '51-100': lambda rate: 51 <= rate <= 100,
+    '101+':   lambda rate: rate > 100,
+}
+
+# Allowed upload extensions; a tuple lets str.endswith check all of them in C
+_ALLOWED_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif')
+
+
+def allowed_file(filename):
+    """Check if file has allowed extension."""
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
 
-        try:
-            # Check if it's a full datetime string (YYYY-MM-DD HH:MM:SS)
-            if len(date_string) > 10 and ' ' in date_string:
-                # Parse "YYYY-MM-DD HH:MM:SS" format and extract only the date
-                dt = datetime.strptime(date_string, "%Y-%m-%d %H:%M:%S")
-                return dt.strftime("%d-%m-%Y")
-            else:
-                # It's already in "DD-MM-YYYY" format
-                return date_string
-        except:
-            # If parsing fails, return original string
-            return date_string
+
+# ============ Per-request model views ============
+# Routes only read these lists, so hand out the internal lists directly
+# via the view_* accessors instead of copying per request; flask.g keeps
+# one reference per request for consistency with the old snapshots.
+def _vehicles():
+    if 'vehicles' not in g:
+        g.vehicles = rental_system.view_vehicles()
+    return g.vehicles
+
+
+def _renters():
+    if 'renters' not in g:
+        g.renters = rental_system.view_renters()
+    return g.renters
+
+
+def _records():
+    if 'rental_records' not in g:
+        g.rental_records = rental_system.view_rental_records()
+    return g.rental_records
+
+
+def init_routes(app):
+    """Initialize all routes for the Flask application."""
 
     # Register the custom filter
     app.jinja_env.filters['format_datetime'] = format_datetime
 
-    # ============ Helper Functions ============
-    def allowed_file(filename):
-        """Check if file has allowed extension."""
-        ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
-        return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    # Cache compiled templates on disk so each worker/restart skips the
+    # Jinja compile step, and pre-compile the hottest templates at boot
+    cache_dir = os.path.join(tempfile.gettempdir(), 'vehicle_rental_jinja_cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=cache_dir)
+
+    for template_name in ('vehicles.html', 'invoice.html', 'staff_analytics.html',
+                          'history.html', 'return_confirmation.html'):
+        app.jinja_env.get_template(template_name)
+
+    @app.teardown_request
+    def flush_rental_data(exception=None):
+        """Persist deferred mutations once per request instead of per click."""
+        rental_system.flush()
 
+    # ============ Helper Functions ============
     def handle_vehicle_image_upload(vehicle_id):
         """Handle vehicle image upload and return filename."""
-        if 'vehicle_image' not in request.files:
-            return 'default.jpg'
+        file = request.files.get('vehicle_image')
 
-        file = request.files['vehicle_image']
-        if file.filename == '':
+        # Reject before touching the stream: no file, empty name, bad extension
+        if not file or not file.filename or not allowed_file(file.filename):
             return 'default.jpg'
 
-        if file and allowed_file(file.filename):
-            # Use vehicle_id as filename with original extension
-            file_ext = file.filename.rsplit('.', 1)[1].lower()
-            filename = f"{vehicle_id}.{file_ext}"
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
-            return filename
+        # Use vehicle_id as filename with original extension
+        file_ext = os.path.splitext(file.filename)[1][1:].lower()
+        filename = f"{vehicle_id}.{file_ext}"
+        upload_folder = app.config['UPLOAD_FOLDER']
+        filepath = os.path.join(upload_folder, filename)
+
+        # Hash the incoming stream; re-uploads of the identical image skip the save
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: file.stream.read(65536), b''):
+            digest.update(chunk)
+        file.stream.seek(0)
+
+        if os.path.exists(filepath):
+            existing = hashlib.blake2b(digest_size=16)
+            with open(filepath, 'rb') as existing_file:
+                for chunk in iter(lambda: existing_file.read(65536), b''):
+                    existing.update(chunk)
+            if existing.digest() == digest.digest():
+                return filename
+
+        # Save via a temp file in the same directory and rename, so the
+        # final name always points at a complete image
+        fd, tmp_path = tempfile.mkstemp(dir=upload_folder)
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                file.save(tmp_file)
+            os.replace(tmp_path, filepath)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
 
-        return 'default.jpg'
+        return filename
 
     # ============ Authentication Decorator ============
-    def login_required(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            if 'user_id' not in session:
-                flash('Please login first.', 'error')
-                return redirect(url_for('login'))
-            return f(*args, **kwargs)
-        return decorated_function
-    
-    def staff_required(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            if 'user_type' not in session or session['user_type'] != 'Staff':
-                flash('Access denied. Staff only.', 'error')
-                return redirect(url_for('dashboard'))
-            return f(*args, **kwargs)
-        return decorated_function
-
-    def non_staff_required(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            if 'user_type' in session and session['user_type'] == 'Staff':
-                flash('Staff cannot rent or return vehicles.', 'error')
-                # Get the vehicle_id from kwargs if available
-                vehicle_id = kwargs.get('vehicle_id')
-                if vehicle_id:
-                    return redirect(url_for('vehicle_detail', vehicle_id=vehicle_id))
-                return redirect(url_for('vehicles'))
-            return f(*args, **kwargs)
-        return decorated_function
+    def require(role=None):
+        """
+        Combined auth decorator: login check plus an optional role check.
+
+        Replaces the stacked login_required/staff_required/non_staff_required
+        decorators so every protected view pays for a single wrapper frame
+        and a single pass over the session.
+        """
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                if 'user_id' not in session:
+                    flash('Please login first.', 'error')
+                    return redirect(url_for('login'))
+                if role == 'staff' and session.get('user_type') != 'Staff':
+                    flash('Access denied. Staff only.', 'error')
+                    return redirect(url_for('dashboard'))
+                if role == 'non_staff' and session.get('user_type') == 'Staff':
+                    flash('Staff cannot rent or return vehicles.', 'error')
+                    # Get the vehicle_id from kwargs if available
+                    vehicle_id = kwargs.get('vehicle_id')
+                    if vehicle_id:
+                        return redirect(url_for('vehicle_detail', vehicle_id=vehicle_id))
+                    return redirect(url_for('vehicles'))
+                return f(*args, **kwargs)
+            return decorated_function
+        return decorator
     
     # ============ Home & Login Routes ============
     @app.route('/')
@@ -151,7 +245,7 @@ def init_routes(app):
     
     # ============ Dashboard Routes ============
     @app.route('/dashboard')
-    @login_required
+    @require()
     def dashboard():
         """Display role-specific dashboard."""
         user_type = session.get('user_type')
@@ -162,30 +256,31 @@ def init_routes(app):
         
         if user_type == 'Staff':
             # Staff dashboard with analytics
-            vehicles = rental_system.get_vehicles()
-            users = rental_system.get_renters()
-            records = rental_system.get_rental_records()
-            active_records = rental_system.get_active_rental_records()
-            
+            records = _records()
+
             return render_template('dashboard_staff.html',
                                  user=user,
-                                 vehicle_count=len(vehicles),
-                                 user_count=len(users),
+                                 vehicle_count=len(_vehicles()),
+                                 user_count=len(_renters()),
                                  rental_count=len(records),
-                                 active_count=len(active_records))
+                                 active_count=sum(1 for r in records if r.is_active()))
         else:
-            # Individual/Corporate dashboard
-            user_rentals = rental_system.get_rental_records_by_renter(user_id)
-            active_rentals = [r for r in user_rentals if r.is_active()]
-            
+            # Individual/Corporate dashboard: count and collect in one pass
+            active_rentals = []
+            total_rentals = 0
+            for record in rental_system.iter_rental_records_by_renter(user_id):
+                total_rentals += 1
+                if record.is_active():
+                    active_rentals.append(record)
+
             return render_template('dashboard_user.html',
                                  user=user,
                                  active_rentals=active_rentals,
-                                 total_rentals=len(user_rentals))
+                                 total_rentals=total_rentals)
     
     # ============ Vehicle Routes ============
     @app.route('/vehicles')
-    @login_required
+    @require()
     def vehicles():
         """Display all vehicles with search/filter."""
         # Get filter parameters
@@ -194,33 +289,27 @@ def init_routes(app):
         price_range = request.args.get('price', '')
         
         # Get all vehicles
-        all_vehicles = rental_system.get_vehicles()
-        
-        # Apply filters
-        filtered_vehicles = all_vehicles
-        
-        if vehicle_type:
-            filtered_vehicles = [v for v in filtered_vehicles if v.get_vehicle_type() == vehicle_type]
-        
-        if brand:
-            filtered_vehicles = [v for v in filtered_vehicles if brand.lower() in v.get_make().lower()]
+        all_vehicles = _vehicles()
+
+        # Resolve the filter predicates once, then apply them in one pass
+        brand_lc = brand.lower() if brand else None
+        price_pred = PRICE_PREDS.get(price_range)
+
+        filtered_vehicles = [
+            v for v in all_vehicles
+            if (not vehicle_type or v.get_vehicle_type() == vehicle_type)
+            and (not brand_lc or brand_lc in v.get_make().lower())
+            and (price_pred is None or price_pred(v.get_daily_rate()))
+        ]
         
-        if price_range:
-            if price_range == '0-50':
-                filtered_vehicles = [v for v in filtered_vehicles if v.get_daily_rate() <= 50]
-            elif price_range == '51-100':
-                filtered_vehicles = [v for v in filtered_vehicles if 51 <= v.get_daily_rate() <= 100]
-            elif price_range == '101+':
-                filtered_vehicles = [v for v in filtered_vehicles if v.get_daily_rate() > 100]
-        
-        return render_template('vehicles.html',
+        return stream_template('vehicles.html',
                              vehicles=filtered_vehicles,
                              current_type=vehicle_type,
                              current_brand=brand,
                              current_price=price_range)
     
     @app.route('/vehicle/<vehicle_id>')
-    @login_required
+    @require()
     def vehicle_detail(vehicle_id):
         """Display vehicle details."""
         vehicle = rental_system._find_vehicle_by_id(vehicle_id)
@@ -237,8 +326,7 @@ def init_routes(app):
     
     # ============ Rental Routes ============
     @app.route('/rent/<vehicle_id>', methods=['GET', 'POST'])
-    @login_required
-    @non_staff_required
+    @require('non_staff')
     def rent_vehicle(vehicle_id):
         """Handle vehicle rental."""
         vehicle = rental_system._find_vehicle_by_id(vehicle_id)
@@ -252,11 +340,11 @@ def init_routes(app):
             user_id = session.get('user_id')
             
             try:
-                # Convert dates to DD-MM-YYYY format
-                start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-                end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-                start_formatted = start_dt.strftime('%d-%m-%Y')
-                end_formatted = end_dt.strftime('%d-%m-%Y')
+                # Convert dates to DD-MM-YYYY format (fromisoformat is the C fast path)
+                start_d = date.fromisoformat(start_date)
+                end_d = date.fromisoformat(end_date)
+                start_formatted = f"{start_d.day:02d}-{start_d.month:02d}-{start_d.year}"
+                end_formatted = f"{end_d.day:02d}-{end_d.month:02d}-{end_d.year}"
                 
                 period = RentalPeriod(start_formatted, end_formatted)
                 
@@ -271,15 +359,27 @@ def init_routes(app):
             except Exception as e:
                 flash(f'Error: {str(e)}', 'error')
 
-        # Get rental periods to disable rented dates in the form
+        # Get rental periods to disable rented dates in the form, serialized
+        # once here so the template inlines a single JSON string instead of
+        # looping with per-row dict lookups
         rental_periods = vehicle.get_rental_periods()
+        rented_periods_json = json.dumps([
+            {
+                'start': p['start_date'],
+                'end': p['end_date'],
+                'actualEnd': p.get('actual_end_date'),
+                'status': p.get('status', 'active'),
+            }
+            for p in rental_periods
+        ])
 
         return render_template('rent_form.html',
                              vehicle=vehicle,
-                             rental_periods=rental_periods)
+                             rental_period_count=len(rental_periods),
+                             rented_periods_json=rented_periods_json)
     
     @app.route('/invoice/<vehicle_id>')
-    @login_required
+    @require()
     def rental_invoice(vehicle_id):
         """Display rental invoice."""
         user_id = session.get('user_id')
@@ -307,20 +407,13 @@ def init_routes(app):
                              user=user)
     
     @app.route('/return/<vehicle_id>', methods=['GET', 'POST'])
-    @login_required
-    @non_staff_required
+    @require('non_staff')
     def return_vehicle(vehicle_id):
         """Handle vehicle return with early/normal/overdue support."""
         user_id = session.get('user_id')
 
-        # Find active rental record
-        active_record = None
-        for record in rental_system.get_rental_records():
-            if (record.get_vehicle_id() == vehicle_id and
-                record.get_renter_id() == user_id and
-                record.is_active()):
-                active_record = record
-                break
+        # Find active rental record via the composite index
+        active_record = rental_system.find_active_rental_record(vehicle_id, user_id)
 
         if not active_record:
             flash('No active rental found for this vehicle.', 'error')
@@ -333,8 +426,8 @@ def init_routes(app):
 
             try:
                 # Convert date format from YYYY-MM-DD to DD-MM-YYYY
-                return_dt = datetime.strptime(return_date, '%Y-%m-%d')
-                return_formatted = return_dt.strftime('%d-%m-%Y')
+                return_d = date.fromisoformat(return_date)
+                return_formatted = f"{return_d.day:02d}-{return_d.month:02d}-{return_d.year}"
 
                 # Process return using new method
                 result = rental_system.return_vehicle_with_date(
@@ -367,7 +460,7 @@ def init_routes(app):
 
 
     @app.route('/history')
-    @login_required
+    @require()
     def rental_history():
         """Display user's rental history."""
         user_id = session.get('user_id')
@@ -375,20 +468,18 @@ def init_routes(app):
         # Get rental records from rental system (includes all return information)
         rental_records = rental_system.get_rental_records_by_renter(user_id)
 
-        return render_template('history.html', rental_records=rental_records)
+        return stream_template('history.html', rental_records=rental_records)
 
     @app.route('/history/invoice/<record_id>')
-    @login_required
+    @require()
     def user_rental_invoice(record_id):
         """Display rental invoice for user's own record."""
         user_id = session.get('user_id')
 
-        # Find the rental record
-        record = None
-        for r in rental_system.get_rental_records():
-            if r.get_record_id() == record_id and r.get_renter_id() == user_id:
-                record = r
-                break
+        # Find the rental record and check ownership
+        record = rental_system.find_rental_record_by_id(record_id)
+        if record and record.get_renter_id() != user_id:
+            record = None
 
         if not record:
             flash('Rental record not found or access denied.', 'error')
@@ -402,15 +493,8 @@ def init_routes(app):
             flash('Vehicle or user information not found.', 'error')
             return redirect(url_for('rental_history'))
 
-        # Prepare rental data
-        rental = {
-            'vehicle_id': record.get_vehicle_id(),
-            'start_date': record.get_start_date(),
-            'end_date': record.get_end_date(),
-            'duration': record.calculate_duration(),
-            'cost': record.get_rental_cost(),
-            'status': record.get_status()
-        }
+        # Invoice summary is cached on the record itself
+        rental = record.get_invoice_view()
 
         return render_template('invoice.html',
                              rental=rental,
@@ -418,17 +502,15 @@ def init_routes(app):
                              user=user)
 
     @app.route('/history/return_invoice/<record_id>')
-    @login_required
+    @require()
     def user_return_invoice(record_id):
         """Display return confirmation invoice for user's own completed record."""
         user_id = session.get('user_id')
 
-        # Find the rental record
-        record = None
-        for r in rental_system.get_rental_records():
-            if r.get_record_id() == record_id and r.get_renter_id() == user_id:
-                record = r
-                break
+        # Find the rental record and check ownership
+        record = rental_system.find_rental_record_by_id(record_id)
+        if record and record.get_renter_id() != user_id:
+            record = None
 
         if not record:
             flash('Rental record not found or access denied.', 'error')
@@ -445,11 +527,21 @@ def init_routes(app):
             flash('Vehicle information not found.', 'error')
             return redirect(url_for('rental_history'))
 
-        # Prepare result data (similar to return_vehicle route)
+        # Serve the summary computed when the return was processed, if present
+        summary = record.get_return_summary()
+        if summary is not None:
+            result = dict(summary, success=True, record=record)
+            return render_template('return_confirmation.html',
+                                 result=result,
+                                 vehicle=vehicle)
+
+        # Legacy records predate the stored summary: recompute from raw fields
         scheduled_days = record.calculate_duration()
         actual_days = record.calculate_actual_duration()
         original_cost = record.get_rental_cost()
-        final_cost = record.get_final_cost() if record.get_final_cost() else original_cost
+        # None-aware fallback: a legitimate 0.00 final cost is not "missing"
+        fc = record.get_final_cost()
+        final_cost = fc if fc is not None else original_cost
 
         # Calculate refund or penalty
         refund = 0
@@ -488,16 +580,14 @@ def init_routes(app):
 
     # ============ Staff Management Routes ============
     @app.route('/staff/users')
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_users():
         """Display all users (staff only)."""
-        users = rental_system.get_renters()
+        users = _renters()
         return render_template('staff_users.html', users=users)
     
     @app.route('/staff/users/add', methods=['GET', 'POST'])
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_add_user():
         """Add new user (staff only)."""
         if request.method == 'POST':
@@ -530,8 +620,7 @@ def init_routes(app):
         return render_template('staff_add_user.html')
     
     @app.route('/staff/users/delete/<user_id>')
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_delete_user(user_id):
         """Delete user (staff only)."""
         # Prevent self-deletion
@@ -539,16 +628,11 @@ def init_routes(app):
             flash('Cannot delete your own account.', 'error')
             return redirect(url_for('staff_users'))
         
-        users = rental_system.get_renters()
-        user_to_delete = None
-        for user in users:
-            if user.get_renter_id() == user_id:
-                user_to_delete = user
-                break
-        
+        user_to_delete = rental_system._find_renter_by_id(user_id)
+
         if user_to_delete:
             rental_system._VehicleRental__renters.remove(user_to_delete)
-            rental_system.save_data()
+            rental_system.mark_dirty()
             flash('User deleted successfully.', 'success')
         else:
             flash('User not found.', 'error')
@@ -556,16 +640,14 @@ def init_routes(app):
         return redirect(url_for('staff_users'))
     
     @app.route('/staff/vehicles')
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_vehicles():
         """Display all vehicles (staff only)."""
-        vehicles = rental_system.get_vehicles()
+        vehicles = _vehicles()
         return render_template('staff_vehicles.html', vehicles=vehicles)
     
     @app.route('/staff/vehicles/add', methods=['GET', 'POST'])
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_add_vehicle():
         """Add new vehicle (staff only)."""
         if request.method == 'POST':
@@ -608,8 +690,7 @@ def init_routes(app):
         return render_template('staff_add_vehicle.html')
     
     @app.route('/staff/vehicles/delete/<vehicle_id>')
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_delete_vehicle(vehicle_id):
         """Delete vehicle (staff only)."""
         vehicle = rental_system._find_vehicle_by_id(vehicle_id)
@@ -620,7 +701,7 @@ def init_routes(app):
                 flash('Cannot delete vehicle. It is currently rented.', 'error')
             else:
                 rental_system._VehicleRental__vehicles.remove(vehicle)
-                rental_system.save_data()
+                rental_system.mark_dirty()
                 flash('Vehicle deleted successfully.', 'success')
         else:
             flash('Vehicle not found.', 'error')
@@ -628,16 +709,15 @@ def init_routes(app):
         return redirect(url_for('staff_vehicles'))
     
     @app.route('/staff/analytics')
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_analytics():
         """Display analytics (staff only)."""
-        vehicles = rental_system.get_vehicles()
-        records = rental_system.get_rental_records()
-        users = rental_system.get_renters()
+        vehicles = _vehicles()
+        records = _records()
+        users = _renters()
 
         # Calculate statistics
-        vehicle_rental_counts = {}
+        vehicle_rental_counts = Counter()
         vehicle_revenue = {}
         total_revenue = 0
         total_days = 0
@@ -651,43 +731,48 @@ def init_routes(app):
         revenue_by_user_type = {'Individual': 0, 'Corporate': 0, 'Staff': 0}
         rentals_by_user_type = {'Individual': 0, 'Corporate': 0, 'Staff': 0}
 
+        # Hoist the bound index lookups out of the hot loop
+        find_vehicle = rental_system._find_vehicle_by_id
+        find_renter = rental_system._find_renter_by_id
+
         for record in records:
             vid = record.get_vehicle_id()
-            vehicle = rental_system._find_vehicle_by_id(vid)
-            user = rental_system._find_renter_by_id(record.get_renter_id())
 
             # Count rentals per vehicle
-            vehicle_rental_counts[vid] = vehicle_rental_counts.get(vid, 0) + 1
+            vehicle_rental_counts[vid] += 1
 
-            if record.is_completed():
-                # Use final cost if available (after return), otherwise use rental cost
-                cost = record.get_final_cost() if record.get_final_cost() else record.get_rental_cost()
-                total_revenue += cost
+            if not record.is_completed():
+                continue
 
-                # Track revenue per vehicle
-                if vid not in vehicle_revenue:
-                    vehicle_revenue[vid] = 0
-                vehicle_revenue[vid] += cost
+            # Use final cost if available (after return), otherwise use rental cost
+            final_cost = record.get_final_cost()
+            cost = final_cost if final_cost else record.get_rental_cost()
+            total_revenue += cost
 
-                # Use actual duration if available, otherwise use scheduled duration
-                if record.get_actual_return_date():
-                    total_days += record.calculate_actual_duration()
-                else:
-                    total_days += record.calculate_duration()
+            # Track revenue per vehicle
+            vehicle_revenue[vid] = vehicle_revenue.get(vid, 0) + cost
 
-                completed_rentals += 1
+            # Use actual duration if available, otherwise use scheduled duration
+            if record.get_actual_return_date():
+                total_days += record.calculate_actual_duration()
+            else:
+                total_days += record.calculate_duration()
 
-                # Revenue by vehicle type
-                if vehicle:
-                    v_type = vehicle.get_vehicle_type()
-                    revenue_by_vehicle_type[v_type] += cost
-                    rentals_by_vehicle_type[v_type] += 1
+            completed_rentals += 1
 
-                # Revenue by user type
-                if user:
-                    u_type = user.get_user_type()
-                    revenue_by_user_type[u_type] += cost
-                    rentals_by_user_type[u_type] += 1
+            # Revenue by vehicle type
+            vehicle = find_vehicle(vid)
+            if vehicle:
+                v_type = vehicle.get_vehicle_type()
+                revenue_by_vehicle_type[v_type] += cost
+                rentals_by_vehicle_type[v_type] += 1
+
+            # Revenue by user type
+            user = find_renter(record.get_renter_id())
+            if user:
+                u_type = user.get_user_type()
+                revenue_by_user_type[u_type] += cost
+                rentals_by_user_type[u_type] += 1
 
         # Calculate average revenue per rental
         avg_revenue = total_revenue / completed_rentals if completed_rentals > 0 else 0
@@ -695,28 +780,26 @@ def init_routes(app):
         # Calculate average rental duration
         avg_days = total_days / completed_rentals if completed_rentals > 0 else 0
 
-        # Top 5 most rented vehicles
-        top_5_rented = sorted(vehicle_rental_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        # Top 5 most rented vehicles (heap selection beats full sorts here)
+        top_5_rented = heapq.nlargest(5, vehicle_rental_counts.items(), key=lambda x: x[1])
         top_5_vehicles = [(rental_system._find_vehicle_by_id(vid), count) for vid, count in top_5_rented]
 
         # Bottom 5 least rented vehicles
-        bottom_5_rented = sorted(vehicle_rental_counts.items(), key=lambda x: x[1])[:5]
+        bottom_5_rented = heapq.nsmallest(5, vehicle_rental_counts.items(), key=lambda x: x[1])
         bottom_5_vehicles = [(rental_system._find_vehicle_by_id(vid), count) for vid, count in bottom_5_rented]
 
         # Top 5 revenue generating vehicles
-        top_5_revenue = sorted(vehicle_revenue.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_5_revenue = heapq.nlargest(5, vehicle_revenue.items(), key=lambda x: x[1])
         top_5_revenue_vehicles = [(rental_system._find_vehicle_by_id(vid), revenue) for vid, revenue in top_5_revenue]
 
-        # Most/least rented (overall)
-        if vehicle_rental_counts:
-            most_rented_id = max(vehicle_rental_counts, key=vehicle_rental_counts.get)
-            least_rented_id = min(vehicle_rental_counts, key=vehicle_rental_counts.get)
-            most_rented = rental_system._find_vehicle_by_id(most_rented_id)
-            least_rented = rental_system._find_vehicle_by_id(least_rented_id)
+        # Most/least rented (overall) fall out of the heap results
+        if top_5_rented:
+            most_rented = rental_system._find_vehicle_by_id(top_5_rented[0][0])
+            least_rented = rental_system._find_vehicle_by_id(bottom_5_rented[0][0])
         else:
             most_rented = least_rented = None
 
-        return render_template('staff_analytics.html',
+        return stream_template('staff_analytics.html',
                              total_revenue=total_revenue,
                              total_rentals=len(records),
                              completed_rentals=completed_rentals,
@@ -736,24 +819,20 @@ def init_routes(app):
                              renters=users)
     
     @app.route('/staff/history')
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_history():
         """Display all rental history (staff only)."""
-        records = rental_system.get_rental_records()
-        return render_template('staff_history.html', records=records)
+        # Rows are precomputed plain dicts so the template loop does no
+        # getter dispatch or date parsing per cell
+        records = rental_system.get_rental_table_rows()
+        return stream_template('staff_history.html', records=records)
 
     @app.route('/staff/invoice/<record_id>')
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_rental_invoice(record_id):
         """Display rental invoice for any record (staff only)."""
-        # Find the rental record
-        record = None
-        for r in rental_system.get_rental_records():
-            if r.get_record_id() == record_id:
-                record = r
-                break
+        # Find the rental record via the ID index
+        record = rental_system.find_rental_record_by_id(record_id)
 
         if not record:
             flash('Rental record not found.', 'error')
@@ -767,15 +846,8 @@ def init_routes(app):
             flash('Vehicle or renter information not found.', 'error')
             return redirect(url_for('staff_history'))
 
-        # Prepare rental data
-        rental = {
-            'vehicle_id': record.get_vehicle_id(),
-            'start_date': record.get_start_date(),
-            'end_date': record.get_end_date(),
-            'duration': record.calculate_duration(),
-            'cost': record.get_rental_cost(),
-            'status': record.get_status()
-        }
+        # Invoice summary is cached on the record itself
+        rental = record.get_invoice_view()
 
         return render_template('invoice.html',
                              rental=rental,
@@ -783,16 +855,11 @@ def init_routes(app):
                              user=user)
 
     @app.route('/staff/return_invoice/<record_id>')
-    @login_required
-    @staff_required
+    @require('staff')
     def staff_return_invoice(record_id):
         """Display return confirmation invoice for any completed record (staff only)."""
-        # Find the rental record
-        record = None
-        for r in rental_system.get_rental_records():
-            if r.get_record_id() == record_id:
-                record = r
-                break
+        # Find the rental record via the ID index
+        record = rental_system.find_rental_record_by_id(record_id)
 
         if not record:
             flash('Rental record not found.', 'error')
@@ -809,24 +876,23 @@ def init_routes(app):
             flash('Vehicle information not found.', 'error')
             return redirect(url_for('staff_history'))
 
-        # Prepare result data (similar to return_vehicle route)
+        # Prepare result data, hoisting each getter to a local once
+        return_type = record.get_return_type() or 'normal'
         scheduled_days = record.calculate_duration()
         actual_days = record.calculate_actual_duration()
         original_cost = record.get_rental_cost()
-        final_cost = record.get_final_cost() if record.get_final_cost() else original_cost
+        # None-aware fallback: a legitimate 0.00 final cost is not "missing"
+        fc = record.get_final_cost()
+        final_cost = fc if fc is not None else original_cost
 
-        # Calculate refund or penalty
+        # Calculate refund or penalty and the corresponding message
         refund = 0
         penalty = 0
-        if record.get_return_type() == 'early':
+        if return_type == 'early':
             refund = original_cost - final_cost
-        elif record.get_return_type() == 'overdue':
-            penalty = final_cost - original_cost
-
-        # Prepare message
-        if record.get_return_type() == 'early':
             message = f"Vehicle returned {scheduled_days - actual_days} day(s) early. Refund issued."
-        elif record.get_return_type() == 'overdue':
+        elif return_type == 'overdue':
+            penalty = final_cost - original_cost
             message = f"Vehicle returned {actual_days - scheduled_days} day(s) late. Overdue penalty applied."
         else:
             message = "Vehicle returned on time."
@@ -834,7 +900,7 @@ def init_routes(app):
         result = {
             'success': True,
             'record': record,
-            'return_type': record.get_return_type() if record.get_return_type() else 'normal',
+            'return_type': return_type,
             'scheduled_end_date': record.get_end_date(),
             'actual_return_date': record.get_actual_return_date(),
             'scheduled_days': scheduled_days,
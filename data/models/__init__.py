@@ -3,23 +3,57 @@ Models package for Vehicle Rental Application.
 
 This package contains all data models and business logic classes
 for the vehicle rental system.
+
+Classes are imported lazily (PEP 562): importing the package no longer
+pulls in every model module up front, only the ones actually used.
 """
 
-from .vehicle import Vehicle
-from .car import Car
-from .motorbike import Motorbike
-from .truck import Truck
-from .renter import Renter
-from .individual_user import IndividualUser
-from .corporate_user import CorporateUser
-from .staff_user import StaffUser
-from .rental_period import RentalPeriod
-from .rental_record import RentalRecord
-from .vehicle_rental import VehicleRental
-from .exceptions import *
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'Vehicle': '.vehicle',
+    'Car': '.car',
+    'Motorbike': '.motorbike',
+    'Truck': '.truck',
+    'Renter': '.renter',
+    'IndividualUser': '.individual_user',
+    'CorporateUser': '.corporate_user',
+    'StaffUser': '.staff_user',
+    'RentalPeriod': '.rental_period',
+    'RentalRecord': '.rental_record',
+    'VehicleRental': '.vehicle_rental',
+    'VehicleRentalException': '.exceptions',
+    'VehicleNotFoundError': '.exceptions',
+    'VehicleNotAvailableError': '.exceptions',
+    'RenterNotFoundError': '.exceptions',
+    'InvalidRentalPeriodError': '.exceptions',
+    'DuplicateVehicleError': '.exceptions',
+    'DuplicateRenterError': '.exceptions',
+    'VehicleAlreadyReturnedError': '.exceptions',
+    'DataPersistenceError': '.exceptions',
+    'InvalidVehicleDataError': '.exceptions',
+    'InvalidRenterDataError': '.exceptions',
+}
 
 __all__ = [
     'Vehicle', 'Car', 'Motorbike', 'Truck',
     'Renter', 'IndividualUser', 'CorporateUser', 'StaffUser',
     'RentalPeriod', 'RentalRecord', 'VehicleRental'
 ]
+
+
+def __getattr__(name):
+    """Resolve a model class on first access and cache it on the package."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    attr = getattr(import_module(module_name, __name__), name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -5,10 +5,31 @@ This module contains the Car class that represents a car in the rental system,
 extending the abstract Vehicle class with car-specific attributes and methods.
 """
 
+from sys import intern
+
 from vehicle import Vehicle
 from rental_period import RentalPeriod
 from exceptions import InvalidVehicleDataError
 
+# Allowed values built once at import: frozensets give O(1) membership in the
+# validators, the tuples keep a stable order for error messages
+_VALID_DOORS = frozenset({2, 3, 4, 5})
+_VALID_FUEL_TYPES = ("Petrol", "Diesel", "Electric", "Hybrid")
+_VALID_TRANSMISSIONS = ("Manual", "Automatic", "CVT")
+
+# Lowercased input -> canonical spelling: one dict lookup replaces the
+# title() + membership check, and handles acronyms like "CVT" that
+# str.title would mangle. Interning means every Car shares the same
+# canonical string objects, so later comparisons hit the identity
+# fast path
+_FUEL_CANON = {fuel.lower(): intern(fuel) for fuel in _VALID_FUEL_TYPES}
+_TRANS_CANON = {trans.lower(): intern(trans) for trans in _VALID_TRANSMISSIONS}
+
+# Error text built once instead of re-joining the tuples on every failure
+_DOORS_ERR = "must be 2, 3, 4, or 5"
+_FUEL_ERR = f"must be one of {', '.join(_VALID_FUEL_TYPES)}"
+_TRANS_ERR = f"must be one of {', '.join(_VALID_TRANSMISSIONS)}"
+
 
 class Car(Vehicle):
     """
@@ -46,45 +67,39 @@ class Car(Vehicle):
     
     def _validate_num_doors(self, num_doors: int) -> int:
         """Validate number of doors."""
-        if not isinstance(num_doors, int):
+        # Exact type check: skips the subclass walk and rejects bools,
+        # which isinstance(x, int) would let through
+        if type(num_doors) is not int:
             raise InvalidVehicleDataError("num_doors", str(num_doors), "must be an integer")
         
-        if num_doors not in [2, 3, 4, 5]:
-            raise InvalidVehicleDataError("num_doors", str(num_doors), "must be 2, 3, 4, or 5")
+        if num_doors not in _VALID_DOORS:
+            raise InvalidVehicleDataError("num_doors", str(num_doors), _DOORS_ERR)
         
         return num_doors
     
     def _validate_fuel_type(self, fuel_type: str) -> str:
         """Validate fuel type."""
-        if not isinstance(fuel_type, str):
+        if type(fuel_type) is not str:
             raise InvalidVehicleDataError("fuel_type", str(fuel_type), "must be a string")
         
-        fuel_type = fuel_type.strip().title()
-        valid_fuel_types = ["Petrol", "Diesel", "Electric", "Hybrid"]
-        
-        if fuel_type not in valid_fuel_types:
-            raise InvalidVehicleDataError(
-                "fuel_type", fuel_type, 
-                f"must be one of {', '.join(valid_fuel_types)}"
-            )
-        
-        return fuel_type
+        canonical = _FUEL_CANON.get(fuel_type.strip().lower())
+
+        if canonical is None:
+            raise InvalidVehicleDataError("fuel_type", fuel_type, _FUEL_ERR)
+
+        return canonical
     
     def _validate_transmission(self, transmission: str) -> str:
         """Validate transmission type."""
-        if not isinstance(transmission, str):
+        if type(transmission) is not str:
             raise InvalidVehicleDataError("transmission", str(transmission), "must be a string")
         
-        transmission = transmission.strip().title()
-        valid_transmissions = ["Manual", "Automatic", "CVT"]
-        
-        if transmission not in valid_transmissions:
-            raise InvalidVehicleDataError(
-                "transmission", transmission,
-                f"must be one of {', '.join(valid_transmissions)}"
-            )
-        
-        return transmission
+        canonical = _TRANS_CANON.get(transmission.strip().lower())
+
+        if canonical is None:
+            raise InvalidVehicleDataError("transmission", transmission, _TRANS_ERR)
+
+        return canonical
     
     # Getter methods
     def get_num_doors(self) -> int:
@@ -103,14 +118,17 @@ class Car(Vehicle):
     def set_num_doors(self, num_doors: int) -> None:
         """Set the number of doors."""
         self.__num_doors = self._validate_num_doors(num_doors)
-    
+        self._invalidate_description()
+
     def set_fuel_type(self, fuel_type: str) -> None:
         """Set the fuel type."""
         self.__fuel_type = self._validate_fuel_type(fuel_type)
-    
+        self._invalidate_description()
+
     def set_transmission(self, transmission: str) -> None:
         """Set the transmission type."""
         self.__transmission = self._validate_transmission(transmission)
+        self._invalidate_description()
     
     def calculate_rental_cost(self, rental_period: RentalPeriod, user_discount: float = 0.0) -> float:
         """
@@ -123,19 +141,26 @@ class Car(Vehicle):
         Returns:
             float: Total rental cost after discounts
         """
-        base_cost = self.get_base_rental_cost(rental_period)
-        final_cost = self.apply_discount(base_cost, user_discount)
+        # Inlined from get_base_rental_cost/apply_discount: this is the hot
+        # path for quotes and analytics, and the two helper calls cost more
+        # than the arithmetic itself
+        base_cost = round(rental_period.calculate_duration() * self.get_daily_rate(), 2)
+
+        # Staff and undiscounted quotes skip the discount maths entirely
+        if user_discount == 0.0:
+            return base_cost
 
-        return round(final_cost, 2)
+        if not 0.0 <= user_discount <= 1.0:
+            user_discount = max(0.0, min(1.0, user_discount))
+
+        return round(base_cost - base_cost * user_discount, 2)
     
     def get_vehicle_type(self) -> str:
         """Get the type of vehicle."""
         return "Car"
     
-    def __str__(self) -> str:
-        """Return a string representation of the car."""
-        availability_status = "Available" if not self.is_currently_rented() else "Rented"
-        
+    def _format_description(self) -> str:
+        """Build the static display string; Vehicle.__str__ caches it and appends the live status."""
         return (f"Car ID: {self.get_vehicle_id()}, {self.get_year()} {self.get_make()} {self.get_model()}, "
                 f"Daily Rate: ${self.get_daily_rate():.2f}, {self.__num_doors}-door {self.__fuel_type} "
-                f"({self.__transmission}), Status: {availability_status}")
\ No newline at end of file
+                f"({self.__transmission})")
\ No newline at end of file
@@ -11,6 +11,11 @@ from rental_period import RentalPeriod
 from exceptions import InvalidRenterDataError
 import re
 
+# Validation patterns compiled once at import so the validators skip the
+# per-call pattern cache lookup inside re.match
+_COMPANY_NAME_RE = re.compile(r'^[A-Za-z0-9\s\'-\.\&\(\),]+$')
+_BUSINESS_REG_RE = re.compile(r'^[A-Z0-9\-\/]+$')
+
 
 class CorporateUser(Renter):
     """
@@ -55,7 +60,7 @@ class CorporateUser(Renter):
             raise InvalidRenterDataError("company_name", company_name, "must be 2-200 characters long")
         
         # Check for valid company name characters
-        if not re.match(r'^[A-Za-z0-9\s\'-\.\&\(\),]+$', company_name):
+        if not _COMPANY_NAME_RE.match(company_name):
             raise InvalidRenterDataError("company_name", company_name, "contains invalid characters")
         
         return company_name
@@ -70,7 +75,7 @@ class CorporateUser(Renter):
             raise InvalidRenterDataError("business_registration", business_registration, "must be 5-30 characters long")
         
         # Check for valid registration format (alphanumeric with some special chars)
-        if not re.match(r'^[A-Z0-9\-\/]+$', business_registration):
+        if not _BUSINESS_REG_RE.match(business_registration):
             raise InvalidRenterDataError("business_registration", business_registration, "invalid format")
         
         return business_registration
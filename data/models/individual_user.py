@@ -9,8 +9,58 @@ individual-specific discount calculations and attributes.
 from renter import Renter
 from rental_period import RentalPeriod
 from exceptions import InvalidRenterDataError
-from datetime import datetime
-import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional
+
+# Allowed characters after upper-casing: a frozenset superset check beats
+# spinning up the regex engine for strings this short
+_LICENSE_ALPHABET = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+
+
+def _is_ddmmyyyy(date_str: str) -> bool:
+    """Structural check for DD-MM-YYYY: fixed positions make a regex overkill."""
+    return (len(date_str) == 10 and date_str[2] == '-' and date_str[5] == '-'
+            and date_str[:2].isdigit() and date_str[3:5].isdigit() and date_str[6:].isdigit())
+
+
+@lru_cache(maxsize=4096)
+def _check_dob(date_of_birth: str, today_ord: int) -> Optional[str]:
+    """
+    Return the rejection reason for a DOB string, or None if acceptable.
+
+    Pure function of (string, day ordinal), so repeat validations of the
+    same birth date — login, profile load — are cache hits; keying on the
+    day makes entries expire naturally at midnight.
+    """
+    if not _is_ddmmyyyy(date_of_birth):
+        return "must be in DD-MM-YYYY format"
+
+    try:
+        birth_ord = date(int(date_of_birth[6:10]), int(date_of_birth[3:5]),
+                         int(date_of_birth[0:2])).toordinal()
+    except ValueError:
+        return "invalid date format"
+
+    if birth_ord > today_ord:
+        return "cannot be in the future"
+
+    age = (today_ord - birth_ord) / 365.25
+    if age < 18:
+        return "user must be at least 18 years old"
+    if age > 120:
+        return "invalid birth date"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _check_license(license_number: str) -> Optional[str]:
+    """Return the rejection reason for an upper-cased licence number, or None."""
+    if len(license_number) < 5 or len(license_number) > 20:
+        return "must be 5-20 characters long"
+    if not _LICENSE_ALPHABET.issuperset(license_number):
+        return "can only contain letters and numbers"
+    return None
 
 
 class IndividualUser(Renter):
@@ -43,54 +93,36 @@ class IndividualUser(Renter):
         self.__date_of_birth = self._validate_date_of_birth(date_of_birth)
         self.__license_number = self._validate_license_number(license_number)
     
-    def _validate_date_of_birth(self, date_of_birth: str) -> str:
-        """Validate date of birth."""
-        if not isinstance(date_of_birth, str) or not date_of_birth.strip():
+    def _validate_date_of_birth(self, date_of_birth: str, _now: datetime = None) -> str:
+        """Validate date of birth; _now lets bulk callers share one clock read."""
+        # str() coercion only where the value can be a non-string
+        if not isinstance(date_of_birth, str):
             raise InvalidRenterDataError("date_of_birth", str(date_of_birth), "must be a non-empty string")
-        
+        if not date_of_birth.strip():
+            raise InvalidRenterDataError("date_of_birth", date_of_birth, "must be a non-empty string")
+
         date_of_birth = date_of_birth.strip()
-        
-        # Basic format validation (DD-MM-YYYY)
-        if not re.match(r'^\d{2}-\d{2}-\d{4}$', date_of_birth):
-            raise InvalidRenterDataError("date_of_birth", date_of_birth, "must be in DD-MM-YYYY format")
-        
-        # Parse and validate date
-        try:
-            birth_date = datetime.strptime(date_of_birth, "%d-%m-%Y")
-            current_date = datetime.now()
-            
-            # Check if birth date is in the future
-            if birth_date > current_date:
-                raise InvalidRenterDataError("date_of_birth", date_of_birth, "cannot be in the future")
-            
-            # Check if person is at least 18 years old
-            age = (current_date - birth_date).days / 365.25
-            if age < 18:
-                raise InvalidRenterDataError("date_of_birth", date_of_birth, "user must be at least 18 years old")
-            
-            # Check if person is not unreasonably old (over 120)
-            if age > 120:
-                raise InvalidRenterDataError("date_of_birth", date_of_birth, "invalid birth date")
-                
-        except ValueError:
-            raise InvalidRenterDataError("date_of_birth", date_of_birth, "invalid date format")
-        
+
+        today_ord = (_now if _now is not None else datetime.now()).toordinal()
+        reason = _check_dob(date_of_birth, today_ord)
+        if reason is not None:
+            raise InvalidRenterDataError("date_of_birth", date_of_birth, reason)
+
         return date_of_birth
-    
+
     def _validate_license_number(self, license_number: str) -> str:
         """Validate driver's license number."""
-        if not isinstance(license_number, str) or not license_number.strip():
+        if not isinstance(license_number, str):
             raise InvalidRenterDataError("license_number", str(license_number), "must be a non-empty string")
-        
+        if not license_number.strip():
+            raise InvalidRenterDataError("license_number", license_number, "must be a non-empty string")
+
         license_number = license_number.strip().upper()
-        
-        if len(license_number) < 5 or len(license_number) > 20:
-            raise InvalidRenterDataError("license_number", license_number, "must be 5-20 characters long")
-        
-        # Check for valid license format (alphanumeric)
-        if not re.match(r'^[A-Z0-9]+$', license_number):
-            raise InvalidRenterDataError("license_number", license_number, "can only contain letters and numbers")
-        
+
+        reason = _check_license(license_number)
+        if reason is not None:
+            raise InvalidRenterDataError("license_number", license_number, reason)
+
         return license_number
     
     # Getter methods
@@ -123,17 +155,16 @@ class IndividualUser(Renter):
         Returns:
             float: Discount percentage (0.0 to 0.1)
         """
-        # Check for required method instead of isinstance to avoid import issues
-        if not hasattr(rental_period, 'calculate_duration'):
+        # EAFP duck-typing (instead of isinstance, to avoid import issues):
+        # hasattr would do the same attribute lookup twice on the success path
+        try:
+            duration = rental_period.calculate_duration()
+        except AttributeError:
             raise TypeError("rental_period must have calculate_duration method")
-        
-        duration = rental_period.calculate_duration()
-        
-        # Discount only for 7+ days
-        if duration >= 7:
-            return 0.10  # 10% discount for 7+ days
-        else:
-            return 0.0   # No discount for short-term rentals
+
+        # 10% only for 7+ days: the bool multiplies to 0.0 or 0.10, which
+        # keeps bulk quote loops branch-free
+        return 0.10 * (duration >= 7)
     
     def get_user_type(self) -> str:
         """Get the type of user."""
@@ -5,10 +5,23 @@ This module contains the Motorbike class that represents a motorbike in the rent
 extending the abstract Vehicle class with motorbike-specific attributes and methods.
 """
 
+from sys import intern
+
 from vehicle import Vehicle
 from rental_period import RentalPeriod
 from exceptions import InvalidVehicleDataError
 
+# Allowed bike types built once at import: the tuple keeps a stable order
+# for error messages; the lowercased-input -> canonical-spelling dict makes
+# validation a single lookup, and interned members mean every Motorbike
+# shares the same canonical string objects so later comparisons hit the
+# identity fast path
+_VALID_BIKE_TYPES = ("Sport", "Cruiser", "Touring", "Adventure", "Standard")
+_BIKE_TYPE_CANON = {bike_type.lower(): intern(bike_type) for bike_type in _VALID_BIKE_TYPES}
+
+# Error text built once instead of re-joining the tuple on every failure
+_BIKE_TYPE_ERR = f"must be one of {', '.join(_VALID_BIKE_TYPES)}"
+
 
 class Motorbike(Vehicle):
     """
@@ -59,16 +72,12 @@ class Motorbike(Vehicle):
         if not isinstance(bike_type, str):
             raise InvalidVehicleDataError("bike_type", str(bike_type), "must be a string")
         
-        bike_type = bike_type.strip().title()
-        valid_bike_types = ["Sport", "Cruiser", "Touring", "Adventure", "Standard"]
-        
-        if bike_type not in valid_bike_types:
-            raise InvalidVehicleDataError(
-                "bike_type", bike_type,
-                f"must be one of {', '.join(valid_bike_types)}"
-            )
-        
-        return bike_type
+        canonical = _BIKE_TYPE_CANON.get(bike_type.strip().lower())
+
+        if canonical is None:
+            raise InvalidVehicleDataError("bike_type", bike_type, _BIKE_TYPE_ERR)
+
+        return canonical
     
     def _validate_has_abs(self, has_abs: bool) -> bool:
         """Validate ABS flag."""
@@ -94,14 +103,17 @@ class Motorbike(Vehicle):
     def set_engine_capacity(self, engine_capacity: int) -> None:
         """Set the engine capacity."""
         self.__engine_capacity = self._validate_engine_capacity(engine_capacity)
-    
+        self._invalidate_description()
+
     def set_bike_type(self, bike_type: str) -> None:
         """Set the bike type."""
         self.__bike_type = self._validate_bike_type(bike_type)
-    
+        self._invalidate_description()
+
     def set_has_abs(self, has_abs: bool) -> None:
         """Set the ABS flag."""
         self.__has_abs = self._validate_has_abs(has_abs)
+        self._invalidate_description()
     
     def calculate_rental_cost(self, rental_period: RentalPeriod, user_discount: float = 0.0) -> float:
         """
@@ -114,20 +126,103 @@ class Motorbike(Vehicle):
         Returns:
             float: Total rental cost after discounts
         """
-        base_cost = self.get_base_rental_cost(rental_period)
-        final_cost = self.apply_discount(base_cost, user_discount)
+        # Inlined from get_base_rental_cost/apply_discount, matching the car
+        # pricing path: two helper calls and their intermediate rounds cost
+        # more than the arithmetic, and one final round is exact enough
+        duration = rental_period.calculate_duration()
+        base_cost = duration * self._get_daily_rate_cents() / 100.0
+
+        # Staff and undiscounted quotes skip the discount maths entirely
+        if user_discount == 0.0:
+            return base_cost
 
-        return round(final_cost, 2)
+        if not 0.0 <= user_discount <= 1.0:
+            user_discount = 0.0 if user_discount < 0.0 else 1.0
+
+        return round(base_cost - base_cost * user_discount, 2)
     
+    @classmethod
+    def price_batch(cls, vehicles, duration_days: int, user_discount: float = 0.0) -> list:
+        """
+        Price many motorbikes for one rental duration in a single pass.
+
+        Catalog pages quote the whole fleet for the same window; pricing
+        here skips the per-vehicle RentalPeriod construction and method
+        chain, and clamps the discount once instead of per vehicle.
+
+        Args:
+            vehicles: Iterable of Motorbike objects to price
+            duration_days (int): Rental duration in days
+            user_discount (float): User-specific discount percentage (0.0 to 1.0)
+
+        Returns:
+            list: Rental cost per vehicle, in input order
+        """
+        if not 0.0 <= user_discount <= 1.0:
+            user_discount = max(0.0, min(1.0, user_discount))
+
+        # Duration and discount are loop invariants, so the whole quote
+        # collapses to one multiply and one round per bike; reading the
+        # rate attribute directly skips a bound-method call per vehicle
+        multiplier = duration_days * (1.0 - user_discount)
+        return [round(vehicle._Vehicle__daily_rate * multiplier, 2)
+                for vehicle in vehicles]
+
     def get_vehicle_type(self) -> str:
         """Get the type of vehicle."""
         return "Motorbike"
     
-    def __str__(self) -> str:
-        """Return a string representation of the motorbike."""
-        availability_status = "Available" if not self.is_currently_rented() else "Rented"
+    def _format_description(self) -> str:
+        """Build the static display string; Vehicle.__str__ caches it and appends the live status."""
         abs_info = "with ABS" if self.__has_abs else "without ABS"
-        
+
         return (f"Motorbike ID: {self.get_vehicle_id()}, {self.get_year()} {self.get_make()} {self.get_model()}, "
                 f"Daily Rate: ${self.get_daily_rate():.2f}, {self.__engine_capacity}cc {self.__bike_type} "
-                f"({abs_info}), Status: {availability_status}")
\ No newline at end of file
+                f"({abs_info})")
+
+
+class MotorbikeFleet:
+    """
+    Column-oriented snapshot of a set of motorbikes for repeated bulk pricing.
+
+    price_batch walks the vehicle objects on every call; a fleet packs the
+    IDs and daily rates (in integer cents) into parallel lists once, so
+    repeated quotes against the same catalog touch only the packed numbers.
+    Rebuild the fleet after rates change.
+    """
+
+    __slots__ = ('_vehicle_ids', '_rate_cents')
+
+    def __init__(self, vehicles) -> None:
+        """
+        Snapshot the fleet columns from an iterable of Motorbike objects.
+
+        Args:
+            vehicles: Iterable of Motorbike objects to include
+        """
+        self._vehicle_ids = [vehicle.get_vehicle_id() for vehicle in vehicles]
+        self._rate_cents = [vehicle._get_daily_rate_cents() for vehicle in vehicles]
+
+    def __len__(self) -> int:
+        """Return the number of motorbikes in the fleet."""
+        return len(self._vehicle_ids)
+
+    def price_all(self, duration_days: int, user_discount: float = 0.0) -> dict:
+        """
+        Quote every bike in the fleet for one rental window.
+
+        Args:
+            duration_days (int): Rental duration in days
+            user_discount (float): User-specific discount percentage (0.0 to 1.0)
+
+        Returns:
+            dict: Mapping of vehicle_id to rental cost
+        """
+        if not 0.0 <= user_discount <= 1.0:
+            user_discount = 0.0 if user_discount < 0.0 else 1.0
+
+        # One multiplier covers duration, discount, and the cents scale;
+        # the loop is a zip over two flat int/str lists
+        multiplier = duration_days * (1.0 - user_discount) / 100.0
+        return {vehicle_id: round(cents * multiplier, 2)
+                for vehicle_id, cents in zip(self._vehicle_ids, self._rate_cents)}
\ No newline at end of file
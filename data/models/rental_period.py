@@ -6,10 +6,24 @@ with start and end dates, and provides methods to calculate duration and
 check for overlaps with other rental periods.
 """
 
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from exceptions import InvalidRentalPeriodError
 
 
+@lru_cache(maxsize=4096)
+def _ord_to_ddmmyyyy(ordinal: int) -> str:
+    """Format a day ordinal to the DD-MM-YYYY display form (cached)."""
+    d = date.fromordinal(ordinal)
+    return f"{d.day:02d}-{d.month:02d}-{d.year}"
+
+
+def _is_ddmmyyyy(date_str: str) -> bool:
+    """Structural check for DD-MM-YYYY: fixed positions make a regex overkill."""
+    return (len(date_str) == 10 and date_str[2] == '-' and date_str[5] == '-'
+            and date_str[:2].isdigit() and date_str[3:5].isdigit() and date_str[6:].isdigit())
+
+
 class RentalPeriod:
     """
     Represents a rental period with start and end dates.
@@ -20,56 +34,165 @@ class RentalPeriod:
 
     Year range for rental periods is configurable via MIN_YEAR and MAX_YEAR.
     """
+    # Fixed attribute set (name-mangled): drops the per-instance __dict__,
+    # which dominates the footprint when many periods are built during
+    # availability sweeps
+    __slots__ = ('_RentalPeriod__start_ord', '_RentalPeriod__end_ord',
+                 '_RentalPeriod__duration', '_RentalPeriod__str_cache')
+
     MIN_YEAR = 2000  # Minimum allowed year for rental period
     MAX_YEAR = 2100  # Maximum allowed year for rental period
     
-    def __init__(self, start_date: str, end_date: str, allow_past_dates: bool = False) -> None:
+    def __init__(self, start_date: str, end_date: str, allow_past_dates: bool = False,
+                 _now: date = None) -> None:
         """
         Initialize a RentalPeriod object.
-        
+
         Args:
             start_date (str): Start date in DD-MM-YYYY format
             end_date (str): End date in DD-MM-YYYY format
             allow_past_dates (bool): Whether to allow past dates (for returns/historical data)
-            
+            _now (date): Optional today snapshot for the past-date check, so
+                bulk callers read the clock once instead of per object
+
         Raises:
             InvalidRentalPeriodError: If date format is invalid or start date is after end date
         """
         try:
-            self.__start_date_obj = self._validate_and_parse_date(start_date, "start", allow_past_dates)
-            self.__end_date_obj = self._validate_and_parse_date(end_date, "end", allow_past_dates)
-            
+            # Endpoints are kept as int day ordinals: comparisons and duration
+            # become plain int arithmetic, and date objects are only
+            # rebuilt on demand in the *_obj getters
+            self.__start_ord = self._validate_and_parse_date(start_date, "start", allow_past_dates, _now)
+            self.__end_ord = self._validate_and_parse_date(end_date, "end", allow_past_dates, _now)
+
             # Check that start date is not after end date
-            if self.__start_date_obj > self.__end_date_obj:
+            if self.__start_ord > self.__end_ord:
                 raise InvalidRentalPeriodError(start_date, end_date, "Start date cannot be after end date")
-            
-            # Store original string format for display
-            self.__start_date = start_date
-            self.__end_date = end_date
+
+            # The display strings are not retained: get_start_date/get_end_date
+            # reformat from the ordinals through a shared cache on demand.
+            # Endpoints only change through the validating setters, so the
+            # duration can be computed once here and kept in step there
+            self.__duration = self.__end_ord - self.__start_ord + 1
+            self.__str_cache = None
             
         except ValueError as e:
             if "InvalidRentalPeriodError" not in str(e):
                 raise InvalidRentalPeriodError(start_date, end_date, str(e))
             raise
     
-    def _validate_and_parse_date(self, date_str: str, date_type: str, allow_past_dates: bool = False) -> datetime:
-        """Validate and parse date string."""
+    @classmethod
+    def bulk_create(cls, pairs, allow_past_dates: bool = False) -> list:
+        """
+        Create many RentalPeriods from (start_date, end_date) pairs.
+
+        Snapshots the clock once so the past-date check does not hit
+        the clock for every period.
+
+        Args:
+            pairs: Iterable of (start_date, end_date) string pairs
+            allow_past_dates (bool): Whether to allow past dates
+
+        Returns:
+            list: The created RentalPeriod objects, in input order
+        """
+        today = date.today()
+        return [cls(start, end, allow_past_dates, _now=today) for start, end in pairs]
+
+    @classmethod
+    def bulk_from_arrays(cls, starts, ends):
+        """
+        Build RentalPeriods for many historical (start, end) string pairs.
+
+        Screens every row with int math first — structure, year bounds, and
+        ordering — so malformed rows are reported by index instead of going
+        through the per-object exception path, and only valid rows pay for
+        construction.
+
+        Args:
+            starts: Sequence of start date strings (DD-MM-YYYY)
+            ends: Sequence of end date strings (DD-MM-YYYY)
+
+        Returns:
+            tuple: (periods, invalid) where periods holds a RentalPeriod per
+                valid row and None per invalid one, and invalid lists the
+                rejected row indices
+        """
+        periods = []
+        invalid = []
+        min_year, max_year = cls.MIN_YEAR, cls.MAX_YEAR
+
+        for index, (start_str, end_str) in enumerate(zip(starts, ends)):
+            if not (isinstance(start_str, str) and isinstance(end_str, str)
+                    and _is_ddmmyyyy(start_str) and _is_ddmmyyyy(end_str)):
+                periods.append(None)
+                invalid.append(index)
+                continue
+
+            try:
+                start_ord = date(int(start_str[6:10]), int(start_str[3:5]), int(start_str[0:2])).toordinal()
+                end_ord = date(int(end_str[6:10]), int(end_str[3:5]), int(end_str[0:2])).toordinal()
+            except ValueError:
+                periods.append(None)
+                invalid.append(index)
+                continue
+
+            if (not min_year <= int(start_str[6:10]) <= max_year
+                    or not min_year <= int(end_str[6:10]) <= max_year
+                    or start_ord > end_ord):
+                periods.append(None)
+                invalid.append(index)
+                continue
+
+            # The row already passed structure, year, and ordering checks,
+            # so skip __init__'s re-validation entirely
+            period = object.__new__(cls)
+            period._set_from_ord(start_ord, end_ord)
+            periods.append(period)
+        return periods, invalid
+
+    def _set_from_ord(self, start_ord: int, end_ord: int) -> None:
+        """
+        Trusted fast path: set both endpoints from pre-validated day ordinals.
+
+        For internal callers (bulk import) that have already checked
+        structure, year bounds, and ordering; the public setters remain the
+        validating entry points.
+        """
+        self.__start_ord = start_ord
+        self.__end_ord = end_ord
+        self.__duration = end_ord - start_ord + 1
+        self.__str_cache = None
+
+    def _validate_and_parse_date(self, date_str: str, date_type: str, allow_past_dates: bool = False,
+                                 _now: date = None) -> int:
+        """Validate and parse a date string to its day ordinal."""
+        date_str = date_str.strip()
+
+        # Cheap structural check first: rejecting malformed input here avoids
+        # the expensive strptime exception path
+        if not _is_ddmmyyyy(date_str):
+            raise InvalidRentalPeriodError(date_str, "", f"Invalid {date_type} date format: expected DD-MM-YYYY")
+
         try:
-            # Parse date string; catch invalid dates and format issues
-            date_obj = datetime.strptime(date_str.strip(), "%d-%m-%Y")
-            
+            # The structure is already verified, so slice out the fields
+            # directly; strptime re-interprets its format string on every call.
+            # Rental math is day-granular, so a plain date is enough
+            day, month, year = int(date_str[0:2]), int(date_str[3:5]), int(date_str[6:10])
+            date_ord = date(year, month, day).toordinal()
+
             # Year range check
-            year = date_obj.year
             if year < self.MIN_YEAR or year > self.MAX_YEAR:
                 raise InvalidRentalPeriodError(date_str, "", f"Invalid {date_type} date: year must be between {self.MIN_YEAR}-{self.MAX_YEAR}")
-            
-            # Don't allow past dates unless explicitly permitted
+
+            # Don't allow past dates unless explicitly permitted; comparing
+            # ordinals makes this a single int test
             if not allow_past_dates:
-                current_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-                if date_obj < current_date:
+                today = _now if _now is not None else date.today()
+                if date_ord < today.toordinal():
                     raise InvalidRentalPeriodError(date_str, "", f"Invalid {date_type} date: cannot be in the past")
-            
-            return date_obj
+
+            return date_ord
         except ValueError as e:
             if "time data" in str(e) or "does not match format" in str(e):
                 raise InvalidRentalPeriodError(date_str, "", f"Invalid {date_type} date format: expected DD-MM-YYYY")
@@ -80,44 +203,53 @@ class RentalPeriod:
     
     # Getter methods
     def get_start_date(self) -> str:
-        """Get the start date of the rental period."""
-        return self.__start_date
-    
+        """Get the start date of the rental period (DD-MM-YYYY)."""
+        return _ord_to_ddmmyyyy(self.__start_ord)
+
     def get_end_date(self) -> str:
-        """Get the end date of the rental period."""
-        return self.__end_date
-    
-    def get_start_date_obj(self) -> datetime:
-        """Get the start date as datetime object."""
-        return self.__start_date_obj
-    
-    def get_end_date_obj(self) -> datetime:
-        """Get the end date as datetime object."""
-        return self.__end_date_obj
+        """Get the end date of the rental period (DD-MM-YYYY)."""
+        return _ord_to_ddmmyyyy(self.__end_ord)
     
+    def get_start_ordinal(self) -> int:
+        """Get the start date as its day ordinal (as stored)."""
+        return self.__start_ord
+
+    def get_end_ordinal(self) -> int:
+        """Get the end date as its day ordinal (as stored)."""
+        return self.__end_ord
+
+    def get_start_date_obj(self) -> date:
+        """Get the start date as a date object (rebuilt from the ordinal)."""
+        return date.fromordinal(self.__start_ord)
+
+    def get_end_date_obj(self) -> date:
+        """Get the end date as a date object (rebuilt from the ordinal)."""
+        return date.fromordinal(self.__end_ord)
+
     # Setter methods
     def set_start_date(self, start_date: str, allow_past_dates: bool = False) -> None:
         """Set the start date of the rental period."""
-        new_start_obj = self._validate_and_parse_date(start_date, "start", allow_past_dates)
-        if new_start_obj > self.__end_date_obj:
-            raise InvalidRentalPeriodError(start_date, self.__end_date, "Start date cannot be after end date")
-        
-        self.__start_date = start_date
-        self.__start_date_obj = new_start_obj
-    
+        new_start_ord = self._validate_and_parse_date(start_date, "start", allow_past_dates)
+        if new_start_ord > self.__end_ord:
+            raise InvalidRentalPeriodError(start_date, self.get_end_date(), "Start date cannot be after end date")
+
+        self.__start_ord = new_start_ord
+        self.__duration = self.__end_ord - self.__start_ord + 1
+        self.__str_cache = None
+
     def set_end_date(self, end_date: str, allow_past_dates: bool = False) -> None:
         """Set the end date of the rental period."""
-        new_end_obj = self._validate_and_parse_date(end_date, "end", allow_past_dates)
-        if self.__start_date_obj > new_end_obj:
-            raise InvalidRentalPeriodError(self.__start_date, end_date, "End date cannot be before start date")
-        
-        self.__end_date = end_date
-        self.__end_date_obj = new_end_obj
-    
+        new_end_ord = self._validate_and_parse_date(end_date, "end", allow_past_dates)
+        if self.__start_ord > new_end_ord:
+            raise InvalidRentalPeriodError(self.get_start_date(), end_date, "End date cannot be before start date")
+
+        self.__end_ord = new_end_ord
+        self.__duration = self.__end_ord - self.__start_ord + 1
+        self.__str_cache = None
+
     def calculate_duration(self) -> int:
-        """Calculate the duration of the rental period in days."""
-        duration = (self.__end_date_obj - self.__start_date_obj).days + 1
-        return duration
+        """Get the duration of the rental period in days (precomputed)."""
+        return self.__duration
     
     def overlaps_with(self, other: 'RentalPeriod') -> bool:
         """
@@ -134,25 +266,59 @@ class RentalPeriod:
         """
         if not isinstance(other, RentalPeriod):
             raise TypeError("Can only check overlap with another RentalPeriod object")
-        
-        # Check if periods overlap using datetime objects
-        return not (self.__end_date_obj < other.get_start_date_obj() or 
-                   other.get_end_date_obj() < self.__start_date_obj)
+
+        # Two int comparisons on the stored ordinals
+        return not (self.__end_ord < other.__start_ord or
+                    other.__end_ord < self.__start_ord)
     
+    @classmethod
+    def bulk_overlaps(cls, candidate: 'RentalPeriod', periods) -> list:
+        """
+        Check one candidate period against many existing bookings at once.
+
+        Avoids constructing a RentalPeriod per comparison: the candidate's
+        endpoints are converted to day ordinals once, and each booking's
+        DD-MM-YYYY strings are sliced straight to ordinals for a pair of
+        int comparisons.
+
+        Args:
+            candidate (RentalPeriod): The period being checked
+            periods: Iterable of (start_date, end_date) DD-MM-YYYY string pairs
+
+        Returns:
+            list: Boolean mask, True where the booking overlaps the candidate;
+                malformed pairs are treated as non-overlapping
+        """
+        cand_start = candidate.__start_ord
+        cand_end = candidate.__end_ord
+
+        mask = []
+        for start_str, end_str in periods:
+            try:
+                start_ord = date(int(start_str[6:10]), int(start_str[3:5]), int(start_str[0:2])).toordinal()
+                end_ord = date(int(end_str[6:10]), int(end_str[3:5]), int(end_str[0:2])).toordinal()
+            except (TypeError, ValueError):
+                mask.append(False)
+                continue
+            mask.append(start_ord <= cand_end and end_ord >= cand_start)
+        return mask
+
     def __str__(self) -> str:
-        """Return a string representation of the rental period."""
-        duration = self.calculate_duration()
-        return f"Rental Period: {self.__start_date} to {self.__end_date} ({duration} days)"
+        """Return a string representation of the rental period (cached)."""
+        if self.__str_cache is None:
+            self.__str_cache = (f"Rental Period: {self.get_start_date()} to {self.get_end_date()} "
+                                f"({self.__duration} days)")
+        return self.__str_cache
     
     def __eq__(self, other) -> bool:
         """Check equality with another rental period."""
         if not isinstance(other, RentalPeriod):
             return False
-        return (self.__start_date_obj == other.get_start_date_obj() and 
-                self.__end_date_obj == other.get_end_date_obj())
-    
+        return (self.__start_ord == other.__start_ord and
+                self.__end_ord == other.__end_ord)
+
     def __lt__(self, other) -> bool:
         """Check if this period starts before another period."""
         if not isinstance(other, RentalPeriod):
             return NotImplemented
-        return self.__start_date_obj < other.get_start_date_obj()
\ No newline at end of file
+        return self.__start_ord < other.__start_ord
\ No newline at end of file
@@ -118,17 +118,49 @@ class RentalRecord:
         """Get the final cost after return adjustments."""
         return self.__final_cost
 
+    def get_invoice_view(self) -> dict:
+        """
+        Get the invoice summary for this record (vehicle, dates, duration, cost, status).
+
+        The dictionary is built on first access and cached until the status
+        or cost changes, so invoice pages don't recompute the duration on
+        every view.
+
+        Returns:
+            dict: Invoice fields keyed as the invoice template expects
+        """
+        try:
+            view = self.__invoice_view
+        except AttributeError:
+            # Records unpickled from older data files predate the cache
+            view = None
+
+        if view is None:
+            view = {
+                'vehicle_id': self.__vehicle_id,
+                'start_date': self.__start_date,
+                'end_date': self.__end_date,
+                'duration': self.calculate_duration(),
+                'cost': self.__rental_cost,
+                'status': self.__status
+            }
+            self.__invoice_view = view
+
+        return view
+
     # Setter methods
     def set_status(self, status: str) -> None:
         """Update the rental status."""
         self.__status = self._validate_status(status)
+        self.__invoice_view = None
         self.__updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
+
     def set_rental_cost(self, rental_cost: float) -> None:
         """Update the rental cost."""
         if rental_cost < 0:
             raise ValueError("Rental cost cannot be negative")
         self.__rental_cost = round(rental_cost, 2)
+        self.__invoice_view = None
         self.__updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Status check methods
@@ -179,6 +211,23 @@ class RentalRecord:
         self.__return_type = return_type.lower()
         self.mark_as_completed()
 
+    def set_return_summary(self, summary: dict) -> None:
+        """
+        Store the computed return summary (days, refund/penalty, message).
+
+        Computed once when the return is processed so invoice views can
+        re-display it without recomputing from the raw fields.
+        """
+        self.__return_summary = summary
+
+    def get_return_summary(self) -> Optional[dict]:
+        """Get the stored return summary, or None for records returned before it existed."""
+        try:
+            return self.__return_summary
+        except AttributeError:
+            # Records unpickled from older data files predate the summary
+            return None
+
     def calculate_duration(self) -> int:
         """
         Calculate the scheduled rental duration in days.
@@ -232,6 +281,38 @@ class RentalRecord:
         
         return False
     
+    def _to_state(self) -> tuple:
+        """
+        Pack the record into a plain tuple for compact persistence.
+
+        Records are pure data, so persisting field tuples instead of full
+        objects drops the per-record class and attribute-name overhead from
+        the data file. The transient invoice cache is rebuilt on demand and
+        is deliberately not included.
+        """
+        return (self.__record_id, self.__vehicle_id, self.__renter_id,
+                self.__start_date, self.__end_date, self.__rental_cost,
+                self.__status, self.__discount_applied, self.__actual_return_date,
+                self.__return_type, self.__final_cost, self.__created_at,
+                self.__updated_at, self.get_return_summary())
+
+    @classmethod
+    def _from_state(cls, state: tuple) -> 'RentalRecord':
+        """
+        Rebuild a record from _to_state output.
+
+        The fields were validated before they were saved, so this skips
+        __init__ and assigns them directly.
+        """
+        record = object.__new__(cls)
+        (record.__record_id, record.__vehicle_id, record.__renter_id,
+         record.__start_date, record.__end_date, record.__rental_cost,
+         record.__status, record.__discount_applied, record.__actual_return_date,
+         record.__return_type, record.__final_cost, record.__created_at,
+         record.__updated_at, record.__return_summary) = state
+        record.__invoice_view = None
+        return record
+
     def to_dict(self) -> dict:
         """
         Convert rental record to dictionary format.
@@ -43,6 +43,10 @@ class Renter(ABC):
         # Rental management
         self.__current_rentals: List[Dict] = []
         self.__rental_history: List[Dict] = []
+
+        # (vehicle_id, start_date, end_date) -> active rental dict, so
+        # completing a rental is one lookup instead of a list scan
+        self.__active_index: Dict[tuple, Dict] = {}
     
     def _validate_renter_id(self, renter_id: str) -> str:
         """Validate renter ID."""
@@ -150,6 +154,26 @@ class Renter(ABC):
         return self.__password == password
     
     # Rental management methods
+    def _get_active_index(self) -> Dict[tuple, Dict]:
+        """
+        Get the (vehicle_id, start, end) -> rental index over current rentals.
+
+        Rebuilt when missing (renters unpickled from older data files) or
+        when its size no longer matches the current rental list.
+        """
+        try:
+            index = self.__active_index
+        except AttributeError:
+            index = None
+
+        if index is None or len(index) != len(self.__current_rentals):
+            index = {
+                (rental['vehicle_id'], rental['start_date'], rental['end_date']): rental
+                for rental in self.__current_rentals
+            }
+            self.__active_index = index
+        return index
+
     def add_rental(self, vehicle_id: str, rental_period: RentalPeriod, rental_cost: float) -> None:
         """Add a new rental to the renter's current rentals."""
         rental_record = {
@@ -160,32 +184,34 @@ class Renter(ABC):
             'cost': rental_cost,
             'status': 'active'
         }
-        
+
+        # Index before appending: the index still matches the list here, so
+        # this is one dict store instead of a rebuild
+        key = (vehicle_id, rental_record['start_date'], rental_record['end_date'])
+        self._get_active_index()[key] = rental_record
         self.__current_rentals.append(rental_record)
         self.__rental_history.append(rental_record.copy())
-    
+
     def complete_rental(self, vehicle_id: str, rental_period: RentalPeriod) -> bool:
         """Complete a rental (move from current to history)."""
-        for i, rental in enumerate(self.__current_rentals):
-            if (rental['vehicle_id'] == vehicle_id and 
-                rental['start_date'] == rental_period.get_start_date() and
-                rental['end_date'] == rental_period.get_end_date()):
-                
-                # Remove from current rentals
-                self.__current_rentals.pop(i)
-                
-                # Update status in history
-                for history_rental in self.__rental_history:
-                    if (history_rental['vehicle_id'] == vehicle_id and 
-                        history_rental['start_date'] == rental_period.get_start_date() and
-                        history_rental['end_date'] == rental_period.get_end_date() and
-                        history_rental['status'] == 'active'):
-                        history_rental['status'] = 'completed'
-                        break
-                
-                return True
-        
-        return False
+        key = (vehicle_id, rental_period.get_start_date(), rental_period.get_end_date())
+        rental = self._get_active_index().pop(key, None)
+        if rental is None:
+            return False
+
+        # Remove from current rentals
+        self.__current_rentals.remove(rental)
+
+        # Update status in history
+        for history_rental in self.__rental_history:
+            if (history_rental['vehicle_id'] == vehicle_id and
+                history_rental['start_date'] == rental_period.get_start_date() and
+                history_rental['end_date'] == rental_period.get_end_date() and
+                history_rental['status'] == 'active'):
+                history_rental['status'] = 'completed'
+                break
+
+        return True
     
     def get_total_spent(self) -> float:
         """Calculate total amount spent on rentals."""
@@ -10,7 +10,30 @@ and access to analytics.
 from renter import Renter
 from rental_period import RentalPeriod
 from exceptions import InvalidRenterDataError
-import re
+from sys import intern
+
+# Allowed characters after upper-casing: a frozenset superset check beats
+# spinning up the regex engine for strings this short
+_EMPID_ALPHABET = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-')
+
+# Role sets built once at import: the permission checks run per request and
+# previously rebuilt a list literal each call. The tuple keeps a stable
+# order for error messages; interned members make membership tests hit the
+# identity fast path for validated roles
+_VALID_ROLE_NAMES = ("Admin", "Manager", "Agent")
+_VALID_ROLES = frozenset(intern(role) for role in _VALID_ROLE_NAMES)
+
+# Permission bits, resolved per role once at construction so each can_*
+# check is a single AND instead of a membership test
+_PERM_PROCESS_RENTALS = 0b0001
+_PERM_MANAGE_USERS = 0b0010
+_PERM_MANAGE_VEHICLES = 0b0100
+_PERM_VIEW_ANALYTICS = 0b1000
+_ROLE_PERMS = {
+    "Admin": 0b1111,
+    "Manager": 0b1111,
+    "Agent": _PERM_PROCESS_RENTALS,
+}
 
 
 class StaffUser(Renter):
@@ -43,37 +66,42 @@ class StaffUser(Renter):
         
         self.__employee_id = self._validate_employee_id(employee_id)
         self.__role = self._validate_role(role)
+        self.__perms = _ROLE_PERMS[self.__role]
         self.__password = password  # In production, this should be hashed
     
     def _validate_employee_id(self, employee_id: str) -> str:
         """Validate employee ID."""
-        if not isinstance(employee_id, str) or not employee_id.strip():
+        # str() coercion only where the value can be a non-string
+        if not isinstance(employee_id, str):
             raise InvalidRenterDataError("employee_id", str(employee_id), "must be a non-empty string")
+        if not employee_id.strip():
+            raise InvalidRenterDataError("employee_id", employee_id, "must be a non-empty string")
         
         employee_id = employee_id.strip().upper()
         if len(employee_id) < 3 or len(employee_id) > 20:
             raise InvalidRenterDataError("employee_id", employee_id, "must be 3-20 characters long")
         
         # Check for valid employee ID format (alphanumeric with optional dash)
-        if not re.match(r'^[A-Z0-9\-]+$', employee_id):
+        if not _EMPID_ALPHABET.issuperset(employee_id):
             raise InvalidRenterDataError("employee_id", employee_id, "invalid format (use letters, numbers, and dashes only)")
         
         return employee_id
     
     def _validate_role(self, role: str) -> str:
         """Validate staff role."""
-        if not isinstance(role, str) or not role.strip():
+        if not isinstance(role, str):
             raise InvalidRenterDataError("role", str(role), "must be a non-empty string")
+        if not role.strip():
+            raise InvalidRenterDataError("role", role, "must be a non-empty string")
         
-        role = role.strip().title()
-        valid_roles = ["Admin", "Manager", "Agent"]
-        
-        if role not in valid_roles:
+        role = intern(role.strip().title())
+
+        if role not in _VALID_ROLES:
             raise InvalidRenterDataError(
                 "role", role,
-                f"must be one of {', '.join(valid_roles)}"
+                f"must be one of {', '.join(_VALID_ROLE_NAMES)}"
             )
-        
+
         return role
     
     # Getter methods
@@ -97,6 +125,7 @@ class StaffUser(Renter):
     def set_role(self, role: str) -> None:
         """Set the staff role."""
         self.__role = self._validate_role(role)
+        self.__perms = _ROLE_PERMS[self.__role]
     
     def set_password(self, password: str) -> None:
         """Set the password."""
@@ -136,21 +165,30 @@ class StaffUser(Renter):
         """Get the type of user."""
         return "Staff"
     
+    def _get_perms(self) -> int:
+        """Get the permission bitmap for this staff member's role."""
+        try:
+            return self.__perms
+        except AttributeError:
+            # Staff unpickled from older data files predate the bitmap
+            self.__perms = _ROLE_PERMS[self.__role]
+            return self.__perms
+
     def can_manage_users(self) -> bool:
         """Check if this staff member can manage users."""
-        return self.__role in ["Admin", "Manager"]
-    
+        return bool(self._get_perms() & _PERM_MANAGE_USERS)
+
     def can_manage_vehicles(self) -> bool:
         """Check if this staff member can manage vehicles."""
-        return self.__role in ["Admin", "Manager"]
-    
+        return bool(self._get_perms() & _PERM_MANAGE_VEHICLES)
+
     def can_view_analytics(self) -> bool:
         """Check if this staff member can view analytics."""
-        return self.__role in ["Admin", "Manager"]
-    
+        return bool(self._get_perms() & _PERM_VIEW_ANALYTICS)
+
     def can_process_rentals(self) -> bool:
         """Check if this staff member can process rentals."""
-        return True  # All staff can process rentals
+        return bool(self._get_perms() & _PERM_PROCESS_RENTALS)
     
     def __str__(self) -> str:
         """Return a string representation of the staff user."""
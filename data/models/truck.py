@@ -96,14 +96,17 @@ class Truck(Vehicle):
     def set_load_capacity(self, load_capacity: float) -> None:
         """Set the load capacity."""
         self.__load_capacity = self._validate_load_capacity(load_capacity)
-    
+        self._invalidate_description()
+
     def set_truck_type(self, truck_type: str) -> None:
         """Set the truck type."""
         self.__truck_type = self._validate_truck_type(truck_type)
-    
+        self._invalidate_description()
+
     def set_has_hydraulic_lift(self, has_hydraulic_lift: bool) -> None:
         """Set the hydraulic lift flag."""
         self.__has_hydraulic_lift = self._validate_has_hydraulic_lift(has_hydraulic_lift)
+        self._invalidate_description()
     
     def calculate_rental_cost(self, rental_period: RentalPeriod, user_discount: float = 0.0) -> float:
         """
@@ -125,11 +128,10 @@ class Truck(Vehicle):
         """Get the type of vehicle."""
         return "Truck"
     
-    def __str__(self) -> str:
-        """Return a string representation of the truck."""
-        availability_status = "Available" if not self.is_currently_rented() else "Rented"
+    def _format_description(self) -> str:
+        """Build the static display string; Vehicle.__str__ caches it and appends the live status."""
         lift_info = "with Hydraulic Lift" if self.__has_hydraulic_lift else "standard"
-        
+
         return (f"Truck ID: {self.get_vehicle_id()}, {self.get_year()} {self.get_make()} {self.get_model()}, "
                 f"Daily Rate: ${self.get_daily_rate():.2f}, {self.__load_capacity}t {self.__truck_type} "
-                f"({lift_info}), Status: {availability_status}")
\ No newline at end of file
+                f"({lift_info})")
\ No newline at end of file
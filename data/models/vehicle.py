@@ -6,20 +6,61 @@ class for all vehicle types in the rental system, defining common
 attributes and methods that all vehicles must implement.
 """
 
-from abc import ABC, abstractmethod
 from typing import List, Dict, Any
-from datetime import datetime
-from exceptions import InvalidVehicleDataError, VehicleNotAvailableError
-import re
+from bisect import bisect_left
+from datetime import date, datetime
+from functools import lru_cache
+from exceptions import InvalidVehicleDataError, InvalidRentalPeriodError, VehicleNotAvailableError
+from rental_period import RentalPeriod
+import string
 
+# Deletion table mapping every allowed ID character to nothing: after
+# translate, anything left over is an invalid character. One C-level pass
+# over the string, no regex engine
+_ID_STRIP = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
 
-class Vehicle(ABC):
+# Snapshotted at import: the year-vs-rate check only needs year granularity,
+# so every validation call reading the clock was wasted work
+_CURRENT_YEAR = datetime.now().year
+
+# str.endswith takes the whole tuple in one C call, so no Python-level
+# loop over the extensions
+_VALID_IMAGE_EXTS = ('.jpg', '.jpeg', '.png', '.gif')
+
+
+@lru_cache(maxsize=1024)
+def _check_make(make: str) -> str:
+    """
+    Return the rejection reason for a stripped make, or None if acceptable.
+
+    The same manufacturer strings recur across the fleet, so a bulk restore
+    validates each distinct make once instead of once per vehicle.
+    """
+    if len(make) < 2 or len(make) > 50:
+        return "must be 2-50 characters long"
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _check_model(model: str) -> str:
+    """Return the rejection reason for a stripped model, or None if acceptable."""
+    if len(model) > 50:
+        return "cannot exceed 50 characters"
+    return None
+
+
+class Vehicle:
     """
     Abstract base class representing a generic vehicle in the rental system.
-    
+
     This class defines the common interface and shared functionality for all
     vehicle types, ensuring consistent behavior across different vehicle
     implementations while allowing for vehicle-specific customizations.
+
+    Deliberately a plain class rather than an ABC: ABCMeta's registry-walking
+    __instancecheck__ taxes every isinstance against Vehicle, and the
+    subclasses are all internal. Subclasses must override the
+    NotImplementedError stubs below.
     """
     
     def __init__(self, vehicle_id: str, make: str, model: str, year: int, daily_rate: float, image_filename: str = 'default.jpg') -> None:
@@ -38,10 +79,16 @@ class Vehicle(ABC):
             InvalidVehicleDataError: If any input parameter is invalid
         """
         self.__vehicle_id = self._validate_vehicle_id(vehicle_id)
+        # Hash computed once: vehicles are used as dict keys and set members,
+        # where every probe would otherwise re-hash the ID string
+        self.__hash = hash(self.__vehicle_id)
         self.__make = self._validate_make(make)
         self.__model = self._validate_model(model)
         self.__year = self._validate_year(year)
         self.__daily_rate = self._validate_daily_rate(daily_rate)
+        # Exact integer cents alongside the display float: cost math on ints
+        # has no accumulated FP drift and needs no per-call round()
+        self.__daily_rate_cents = round(self.__daily_rate * 100)
         self.__image_filename = self._validate_image_filename(image_filename)
 
         # Cross-field validation
@@ -50,19 +97,34 @@ class Vehicle(ABC):
         # Rental management - support multiple rentals
         self.__rental_periods: List[Dict[str, Any]] = []
         self.__rental_history: List[Dict[str, Any]] = []
-    
-    def _validate_vehicle_id(self, vehicle_id: str) -> str:
+
+        # Sorted (start_ord, end_ord) pairs over the bookings, rebuilt lazily
+        # after mutations so availability checks can bisect instead of
+        # scanning every booking
+        self.__interval_index = None
+
+        # Cached read-only snapshots handed out by the getters, so repeated
+        # reads while rendering don't each clone the whole list
+        self.__periods_snapshot = None
+        self.__history_snapshot = None
+
+        # Static display string built on first __str__ and reused until a
+        # setter changes one of the formatted fields
+        self.__description = None
+
+    @staticmethod
+    def _validate_vehicle_id(vehicle_id: str) -> str:
         """Validate vehicle ID."""
         if not isinstance(vehicle_id, str) or not vehicle_id.strip():
             raise InvalidVehicleDataError("vehicle_id", str(vehicle_id), "must be a non-empty string")
-        
+
         vehicle_id = vehicle_id.strip()
         if len(vehicle_id) < 2 or len(vehicle_id) > 20:
             raise InvalidVehicleDataError("vehicle_id", vehicle_id, "must be 2-20 characters long")
-        
-        if not re.match(r'^[A-Za-z0-9_-]+$', vehicle_id):
+
+        if vehicle_id.translate(_ID_STRIP):
             raise InvalidVehicleDataError("vehicle_id", vehicle_id, "invalid characters")
-        
+
         return vehicle_id
     
     def _validate_make(self, make: str) -> str:
@@ -71,9 +133,10 @@ class Vehicle(ABC):
             raise InvalidVehicleDataError("make", str(make), "must be a non-empty string")
         
         make = make.strip()
-        if len(make) < 2 or len(make) > 50:
-            raise InvalidVehicleDataError("make", make, "must be 2-50 characters long")
-        
+        reason = _check_make(make)
+        if reason is not None:
+            raise InvalidVehicleDataError("make", make, reason)
+
         return make
     
     def _validate_model(self, model: str) -> str:
@@ -82,9 +145,10 @@ class Vehicle(ABC):
             raise InvalidVehicleDataError("model", str(model), "must be a non-empty string")
         
         model = model.strip()
-        if len(model) > 50:
-            raise InvalidVehicleDataError("model", model, "cannot exceed 50 characters")
-        
+        reason = _check_model(model)
+        if reason is not None:
+            raise InvalidVehicleDataError("model", model, reason)
+
         return model
     
     def _validate_year(self, year: int) -> int:
@@ -119,8 +183,7 @@ class Vehicle(ABC):
         Raises:
             InvalidVehicleDataError: If year and rate combination is unrealistic
         """
-        from datetime import datetime
-        current_year = datetime.now().year
+        current_year = _CURRENT_YEAR
 
         # Future model vehicles must have higher rates
         if year > current_year and daily_rate < 50:
@@ -149,9 +212,8 @@ class Vehicle(ABC):
 
         image_filename = image_filename.strip()
 
-        # Check for valid image extensions
-        valid_extensions = ['.jpg', '.jpeg', '.png', '.gif']
-        if not any(image_filename.lower().endswith(ext) for ext in valid_extensions):
+        # Check for valid image extensions: one lowercase, one suffix test
+        if not image_filename.lower().endswith(_VALID_IMAGE_EXTS):
             return 'default.jpg'
 
         return image_filename
@@ -177,54 +239,136 @@ class Vehicle(ABC):
         """Get the vehicle's daily rental rate."""
         return self.__daily_rate
     
-    def get_rental_periods(self) -> List[Dict[str, Any]]:
-        """Get all current rental periods for this vehicle."""
-        return self.__rental_periods.copy()
-    
-    def get_rental_history(self) -> List[Dict[str, Any]]:
-        """Get the rental history for this vehicle."""
-        return self.__rental_history.copy()
+    def get_rental_periods(self) -> tuple:
+        """Get all current rental periods for this vehicle (read-only)."""
+        try:
+            snapshot = self.__periods_snapshot
+        except AttributeError:
+            # Vehicles unpickled from older data files predate the snapshots
+            snapshot = None
+        if snapshot is None:
+            snapshot = self.__periods_snapshot = tuple(self.__rental_periods)
+        return snapshot
+
+    def get_rental_history(self) -> tuple:
+        """Get the rental history for this vehicle (read-only)."""
+        try:
+            snapshot = self.__history_snapshot
+        except AttributeError:
+            snapshot = None
+        if snapshot is None:
+            snapshot = self.__history_snapshot = tuple(self.__rental_history)
+        return snapshot
 
     def get_image_filename(self) -> str:
         """Get the vehicle's image filename."""
-        # Backward compatibility: return default if attribute doesn't exist
-        if not hasattr(self, '_Vehicle__image_filename'):
-            return 'default.jpg'
         return self.__image_filename
 
     # Setter methods
     def set_vehicle_id(self, vehicle_id: str) -> None:
         """Set the vehicle's unique identifier."""
         self.__vehicle_id = self._validate_vehicle_id(vehicle_id)
-    
+        self.__hash = hash(self.__vehicle_id)
+        self._invalidate_description()
+
     def set_make(self, make: str) -> None:
         """Set the vehicle's manufacturer."""
         self.__make = self._validate_make(make)
-    
+        self._invalidate_description()
+
     def set_model(self, model: str) -> None:
         """Set the vehicle's model."""
         self.__model = self._validate_model(model)
-    
+        self._invalidate_description()
+
     def set_year(self, year: int) -> None:
         """Set the vehicle's manufacturing year."""
         validated_year = self._validate_year(year)
         # Cross-validate with existing daily rate
         self._validate_vehicle_year_vs_rate(validated_year, self.__daily_rate)
         self.__year = validated_year
-    
+        self._invalidate_description()
+
     def set_daily_rate(self, daily_rate: float) -> None:
         """Set the vehicle's daily rental rate."""
         validated_rate = self._validate_daily_rate(daily_rate)
         # Cross-validate with existing year
         self._validate_vehicle_year_vs_rate(self.__year, validated_rate)
         self.__daily_rate = validated_rate
+        self.__daily_rate_cents = round(validated_rate * 100)
+        self._invalidate_description()
 
     def set_image_filename(self, image_filename: str) -> None:
         """Set the vehicle's image filename."""
         # Use name mangling to set the attribute
         self._Vehicle__image_filename = self._validate_image_filename(image_filename)
 
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore pickled state, upgrading vehicles from older data files.
+
+        Filling in missing fields once here keeps the hot readers trivial —
+        get_image_filename no longer needs a per-call hasattr check.
+        """
+        state.setdefault('_Vehicle__image_filename', 'default.jpg')
+        state.setdefault('_Vehicle__interval_index', None)
+        state.setdefault('_Vehicle__periods_snapshot', None)
+        state.setdefault('_Vehicle__history_snapshot', None)
+        state.setdefault('_Vehicle__hash', hash(state['_Vehicle__vehicle_id']))
+        state.setdefault('_Vehicle__daily_rate_cents', round(state['_Vehicle__daily_rate'] * 100))
+        state.setdefault('_Vehicle__description', None)
+        self.__dict__.update(state)
+
     # Rental management methods
+    def _get_interval_index(self) -> list:
+        """
+        Get the sorted (start_ord, end_ord) index over current bookings.
+
+        Rebuilt lazily after add_rental/remove_rental/restore_active_rental
+        invalidate it. Each booking contributes its effective window — the
+        actual return date bounds completed rentals. Bookings carry a cached
+        RentalPeriod under '_period_obj' whose ordinals are reused directly;
+        rows from older data files are sliced from their DD-MM-YYYY strings.
+        """
+        try:
+            index = self.__interval_index
+        except AttributeError:
+            # Vehicles unpickled from older data files predate the index
+            index = None
+
+        if index is None:
+            index = []
+            for period_dict in self.__rental_periods:
+                completed_early = (period_dict.get('status') == 'completed'
+                                   and 'actual_end_date' in period_dict)
+
+                # Bookings written by add_rental/remove_rental carry their
+                # ordinals directly — no parsing at all
+                start_ord = period_dict.get('start_ord')
+                end_ord = (period_dict.get('actual_end_ord') if completed_early
+                           else period_dict.get('end_ord'))
+                if start_ord is not None and end_ord is not None:
+                    index.append((start_ord, end_ord))
+                    continue
+
+                cached_period = period_dict.get('_period_obj')
+                if cached_period is not None:
+                    index.append((cached_period.get_start_ordinal(),
+                                  cached_period.get_end_ordinal()))
+                    continue
+
+                end_str = period_dict['actual_end_date'] if completed_early else period_dict.get('end_date')
+                start_str = period_dict.get('start_date')
+                try:
+                    index.append((date(int(start_str[6:10]), int(start_str[3:5]), int(start_str[0:2])).toordinal(),
+                                  date(int(end_str[6:10]), int(end_str[3:5]), int(end_str[0:2])).toordinal()))
+                except (TypeError, ValueError):
+                    # A malformed legacy row cannot block any booking
+                    continue
+            index.sort()
+            self.__interval_index = index
+        return index
+
     def is_available(self, rental_period) -> bool:
         """
         Check if the vehicle is available for the given rental period.
@@ -236,27 +380,27 @@ class Vehicle(ABC):
                 hasattr(rental_period, 'overlaps_with')):
             raise TypeError("rental_period must be a RentalPeriod object with required methods")
 
-        # Check against all existing rental periods using overlaps_with method
-        from rental_period import RentalPeriod
-        for existing_period_dict in self.__rental_periods:
-            try:
-                # For completed rentals, use actual_end_date if available
-                # For active rentals, use scheduled end_date
-                if existing_period_dict.get('status') == 'completed' and 'actual_end_date' in existing_period_dict:
-                    end_date = existing_period_dict['actual_end_date']
-                else:
-                    end_date = existing_period_dict['end_date']
-
-                existing_period = RentalPeriod(
-                    existing_period_dict['start_date'],
-                    end_date,
-                    allow_past_dates=True  # Allow past dates when checking existing periods
-                )
-                if rental_period.overlaps_with(existing_period):
-                    return False
-            except Exception:
-                continue
-
+        index = self._get_interval_index()
+        if not index:
+            return True
+
+        # RentalPeriod exposes its stored ordinals directly; objects that
+        # merely duck-type the interface fall back to their date strings
+        try:
+            q_start = rental_period.get_start_ordinal()
+            q_end = rental_period.get_end_ordinal()
+        except AttributeError:
+            start_str = rental_period.get_start_date()
+            end_str = rental_period.get_end_date()
+            q_start = date(int(start_str[6:10]), int(start_str[3:5]), int(start_str[0:2])).toordinal()
+            q_end = date(int(end_str[6:10]), int(end_str[3:5]), int(end_str[0:2])).toordinal()
+
+        # Everything starting after the query window cannot overlap, so
+        # bisect it away; the remaining prefix only needs an end-bound test
+        hi = bisect_left(index, (q_end + 1,))
+        for i in range(hi):
+            if index[i][1] >= q_start:
+                return False
         return True
     
     def add_rental(self, rental_period, renter_id: str) -> None:
@@ -271,6 +415,10 @@ class Vehicle(ABC):
         rental_dict = {
             'start_date': rental_period.get_start_date(),
             'end_date': rental_period.get_end_date(),
+            # Day ordinals persisted alongside the display strings, so the
+            # interval index can rebuild without re-parsing dates
+            'start_ord': rental_period.get_start_ordinal(),
+            'end_ord': rental_period.get_end_ordinal(),
             'duration': rental_period.calculate_duration(),
             'renter_id': renter_id,
             'status': 'active'
@@ -278,6 +426,14 @@ class Vehicle(ABC):
         
         self.__rental_periods.append(rental_dict)
         self.__rental_history.append(rental_dict.copy())
+        # Cached after the history copy so history rows stay plain data;
+        # the interval index reuses this object instead of re-parsing dates
+        rental_dict['_period_obj'] = rental_period
+        self.__interval_index = None
+        # Only list membership invalidates the snapshots: the in-place
+        # status updates in remove/restore flow through the shared dicts
+        self.__periods_snapshot = None
+        self.__history_snapshot = None
     
     def remove_rental(self, rental_period, actual_return_date: str = None) -> bool:
         """
@@ -302,6 +458,18 @@ class Vehicle(ABC):
                 else:
                     period_dict['actual_end_date'] = rental_period.get_end_date()
 
+                # Refresh the cached period so availability checks honour the
+                # actual return bound; drop it if that bound cannot be rebuilt
+                try:
+                    period_dict['_period_obj'] = RentalPeriod(
+                        period_dict['start_date'], period_dict['actual_end_date'],
+                        allow_past_dates=True)
+                    period_dict['actual_end_ord'] = period_dict['_period_obj'].get_end_ordinal()
+                except InvalidRentalPeriodError:
+                    period_dict.pop('_period_obj', None)
+                    period_dict.pop('actual_end_ord', None)
+                self.__interval_index = None
+
                 # Update rental history
                 for record in self.__rental_history:
                     if (record['start_date'] == rental_period.get_start_date() and
@@ -332,6 +500,10 @@ class Vehicle(ABC):
                 period_dict['status'] = 'active'
                 if 'actual_end_date' in period_dict:
                     del period_dict['actual_end_date']
+                period_dict.pop('actual_end_ord', None)
+                # Back on the scheduled bound, so cache the scheduled period
+                period_dict['_period_obj'] = rental_period
+                self.__interval_index = None
 
                 # Update rental history
                 for record in self.__rental_history:
@@ -349,41 +521,83 @@ class Vehicle(ABC):
         """Check if the vehicle is currently rented (has active rentals)."""
         return any(period['status'] == 'active' for period in self.__rental_periods)
     
+    def _get_daily_rate_cents(self) -> int:
+        """Get the daily rate in integer cents."""
+        try:
+            return self.__daily_rate_cents
+        except AttributeError:
+            # Vehicles unpickled from older data files predate the cents field
+            self.__daily_rate_cents = round(self.__daily_rate * 100)
+            return self.__daily_rate_cents
+
     def get_base_rental_cost(self, rental_period) -> float:
         """Calculate base rental cost without discounts."""
         duration = rental_period.calculate_duration()
-        return round(duration * self.__daily_rate, 2)
+        # days x cents is exact integer math; dividing once at the boundary
+        # yields a value already exact to the cent, so no round() is needed
+        return duration * self._get_daily_rate_cents() / 100.0
     
     def apply_discount(self, base_cost: float, discount_percentage: float) -> float:
         """Apply discount to base cost."""
+        # Conditional clamp: the in-range chained comparison is the common
+        # case and skips the min()/max() tuple packing entirely
         if not 0.0 <= discount_percentage <= 1.0:
-            discount_percentage = max(0.0, min(1.0, discount_percentage))
-        
-        discount_amount = base_cost * discount_percentage
-        final_cost = base_cost - discount_amount
-        return round(final_cost, 2)
+            discount_percentage = 0.0 if discount_percentage < 0.0 else 1.0
+        return round(base_cost * (1.0 - discount_percentage), 2)
     
-    @abstractmethod
     def calculate_rental_cost(self, rental_period, user_discount: float = 0.0) -> float:
         """Calculate the rental cost for a given period with discount."""
-        pass
-    
-    @abstractmethod
+        raise NotImplementedError("Subclasses must implement calculate_rental_cost")
+
     def get_vehicle_type(self) -> str:
         """Get the type of vehicle."""
-        pass
-    
-    @abstractmethod
+        raise NotImplementedError("Subclasses must implement get_vehicle_type")
+
+    def _format_description(self) -> str:
+        """Build the static portion of the display string (everything but status)."""
+        raise NotImplementedError("Subclasses must implement _format_description")
+
+    def _get_description(self) -> str:
+        """
+        Get the cached static display string for this vehicle.
+
+        __str__ runs once per vehicle per listing, and the identifying
+        fields it formats change only through setters, so the formatted
+        prefix is built once and reused until a setter invalidates it.
+        """
+        try:
+            description = self.__description
+        except AttributeError:
+            # Vehicles unpickled from older data files predate the cache
+            description = None
+
+        if description is None:
+            description = self._format_description()
+            self.__description = description
+        return description
+
+    def _invalidate_description(self) -> None:
+        """Drop the cached display string after a displayed field changes."""
+        self.__description = None
+
     def __str__(self) -> str:
         """Return a string representation of the vehicle."""
-        pass
+        availability_status = "Available" if not self.is_currently_rented() else "Rented"
+        return f"{self._get_description()}, Status: {availability_status}"
     
     def __eq__(self, other) -> bool:
         """Check equality based on vehicle ID."""
         if not isinstance(other, Vehicle):
             return False
-        return self.__vehicle_id == other.get_vehicle_id()
-    
+        # Direct attribute read: set/dict probes pay this per comparison,
+        # so skip the bound-method call through the getter
+        return self.__vehicle_id == other._Vehicle__vehicle_id
+
     def __hash__(self) -> int:
-        """Generate hash based on vehicle ID."""
-        return hash(self.__vehicle_id)
\ No newline at end of file
+        """Return the cached hash based on vehicle ID."""
+        try:
+            return self.__hash
+        except AttributeError:
+            # Vehicles unpickled from older data files predate the cache
+            self.__hash = hash(self.__vehicle_id)
+            return self.__hash
\ No newline at end of file
@@ -6,18 +6,15 @@ and renters, providing methods for rental operations with comprehensive validati
 data persistence using pickle, and support for multiple rentals per vehicle.
 """
 
+import gzip
 import pickle
 import os
-from typing import List, Optional
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from vehicle import Vehicle
-from car import Car
-from motorbike import Motorbike
-from truck import Truck
 from renter import Renter
-from individual_user import IndividualUser
-from corporate_user import CorporateUser
-from staff_user import StaffUser
 from rental_period import RentalPeriod
 from rental_record import RentalRecord
 from exceptions import (
@@ -26,6 +23,26 @@ from exceptions import (
     DataPersistenceError
 )
 
+# Everything the save/log paths can raise, built once instead of assembling
+# the tuple inside each except clause
+_PERSISTENCE_ERRORS = (IOError, pickle.PickleError, OSError)
+
+# Rental confirmation banner assembled once at import; each confirmation is
+# then a single format + print instead of ten separate print calls
+_RENTAL_CONFIRMATION_TEMPLATE = (
+    "\n" + "=" * 60 + "\n"
+    "RENTAL CONFIRMATION\n"
+    + "=" * 60 + "\n"
+    "Vehicle ID: {vehicle_id}\n"
+    "Vehicle: {year} {make} {model} ({vehicle_type})\n"
+    "Renter: {renter_name} ({user_type})\n"
+    "Period: {start_date} to {end_date}\n"
+    "Duration: {duration} days\n"
+    "Discount Applied: {discount_pct:.1f}%\n"
+    "Total Cost: ${rental_cost:.2f}\n"
+    + "=" * 60
+)
+
 
 class VehicleRental:
     """
@@ -36,21 +53,73 @@ class VehicleRental:
     validation, error handling, and data persistence using pickle.
     """
     
-    def __init__(self, data_file: str = "vehicle_rental_data.pkl") -> None:
+    def __init__(self, data_file: str = "vehicle_rental_data.pkl", compress: bool = False) -> None:
         """
         Initialize the VehicleRental system.
-        
+
         Args:
             data_file (str): Path to the data persistence file
+            compress (bool): Whether to gzip the pickle stream on save.
+                Loading detects the format, so either kind of file opens
+                regardless of this flag.
         """
+        self.__compress = compress
+
+        # ":memory:" (or None) runs the system without a backing file:
+        # startup skips the disk probe and every save/log write is a no-op.
+        # Tests use this to avoid per-test file I/O.
+        self.__persistent = data_file not in (None, ':memory:')
+
         self.__vehicles: List[Vehicle] = []
         self.__renters: List[Renter] = []
         self.__rental_records: List[RentalRecord] = []
         self.__data_file = data_file
         self.__next_record_id = 1  # Counter for generating rental record IDs
-        
+
+        # ID -> object indexes so hot lookups are O(1) instead of list scans
+        self.__vehicle_index: Dict[str, Vehicle] = {}
+        self.__renter_index: Dict[str, Renter] = {}
+
+        # Secondary record indexes: record ID -> record, and
+        # (vehicle_id, renter_id) -> active record. Each tracks how many
+        # records it was built from so external list mutation forces a rebuild.
+        self.__record_id_index: Dict[str, RentalRecord] = {}
+        self.__record_id_index_count = 0
+        self.__active_pair_index: Dict[Tuple[str, str], RentalRecord] = {}
+        self.__active_pair_index_count = 0
+        self.__active_records: List[RentalRecord] = []
+        self.__active_records_count = 0
+
+        # Reverse indexes: vehicle ID / renter ID -> that party's records,
+        # with the same covered-count rebuild scheme as the other indexes
+        self.__records_by_vehicle: Dict[str, List[RentalRecord]] = {}
+        self.__records_by_vehicle_count = 0
+        self.__records_by_renter: Dict[str, List[RentalRecord]] = {}
+        self.__records_by_renter_count = 0
+
+        # Type buckets: concrete class -> members of that class, filled at
+        # insert time so the grouped displays concatenate buckets instead of
+        # re-running isinstance scans; count-tracked like the other indexes
+        self.__vehicles_by_type: Dict[type, List[Vehicle]] = {}
+        self.__vehicles_by_type_count = 0
+        self.__renters_by_type: Dict[type, List[Renter]] = {}
+        self.__renters_by_type_count = 0
+
+        # Vehicle IDs with at least one active rental period, so the display
+        # partitions test set membership instead of scanning every vehicle's
+        # period list per call
+        self.__currently_rented_ids: set = set()
+
+        # Set by mutators that defer persistence; flush() saves when True
+        self.__dirty = False
+
+        # True while load_data replays the event log, so replayed rentals
+        # are not appended to the log a second time
+        self.__replaying = False
+
         # Load existing data on startup
-        self.load_data()
+        if self.__persistent:
+            self.load_data()
     
     def save_data(self) -> None:
         """
@@ -59,23 +128,132 @@ class VehicleRental:
         Raises:
             DataPersistenceError: If saving fails
         """
+        if not self.__persistent:
+            self.__dirty = False
+            return
+
         try:
             data = {
                 'vehicles': self.__vehicles,
                 'renters': self.__renters,
-                'rental_records': self.__rental_records,
+                # Records are pure data: field tuples pickle far smaller and
+                # faster than the objects, whose attribute names would repeat
+                # per record. Vehicles/renters stay full object graphs.
+                'rental_records': [record._to_state() for record in self.__rental_records],
                 'next_record_id': self.__next_record_id,
-                'save_timestamp': datetime.now().isoformat(),
-                'version': '3.0'
+                # Epoch float: one allocation instead of a datetime plus a 26-char
+                # string per save; readers can format it on demand
+                'save_timestamp': time.time(),
+                'version': '3.1'
             }
 
-            with open(self.__data_file, 'wb') as file:
-                pickle.dump(data, file)
+            if self.__compress:
+                # Fastest gzip level: the duplicated string fields compress
+                # heavily anyway, and CPU work overlaps the disk writes
+                with gzip.open(self.__data_file, 'wb', compresslevel=1) as file:
+                    pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            else:
+                # 1 MiB buffer: the C pickler streams many small writes, and
+                # the default 8 KiB buffer turns each spill into a syscall
+                with open(self.__data_file, 'wb', buffering=1 << 20) as file:
+                    # Highest protocol (5): denser opcodes and faster framing
+                    # than the backwards-compatible default; load auto-detects
+                    pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            self.__dirty = False
+
+            # The snapshot now covers everything the log recorded
+            try:
+                os.remove(self.__data_file + '.log')
+            except OSError:
+                pass
 
             print(f"Data successfully saved to {self.__data_file}")
 
-        except (IOError, pickle.PickleError, OSError) as e:
+        except _PERSISTENCE_ERRORS as e:
             raise DataPersistenceError("saving", str(e))
+
+    def reset(self) -> None:
+        """
+        Clear all vehicles, renters, and rental records in place.
+
+        For callers (chiefly tests) that reuse one system instance between
+        scenarios. The eagerly maintained indexes are cleared with the
+        lists; the count-tracked ones rebuild themselves on next access.
+        """
+        self.__vehicles.clear()
+        self.__renters.clear()
+        self.__rental_records.clear()
+        self.__vehicle_index.clear()
+        self.__renter_index.clear()
+        self.__currently_rented_ids.clear()
+
+    def mark_dirty(self) -> None:
+        """Record that in-memory state has changed and needs persisting."""
+        self.__dirty = True
+
+    def flush(self) -> None:
+        """Save to disk only if there are unsaved changes."""
+        if self.__dirty:
+            try:
+                self.save_data()
+            except DataPersistenceError as e:
+                print(f"Warning: Could not flush data: {e}")
+
+    def _append_event(self, event: dict) -> None:
+        """
+        Append one rental event to the write-ahead log.
+
+        Appending a tiny event per rent/return is O(1) while the snapshot
+        scales with the whole system, so crash safety between flushes no
+        longer costs a full re-pickle. save_data removes the log once a
+        snapshot covers it; load_data replays whatever is left.
+        """
+        if self.__replaying or not self.__persistent:
+            return
+        try:
+            with open(self.__data_file + '.log', 'ab') as log:
+                pickle.dump(event, log, protocol=pickle.HIGHEST_PROTOCOL)
+        except _PERSISTENCE_ERRORS as e:
+            print(f"Warning: Could not log rental event: {e}")
+
+    def _replay_event_log(self) -> None:
+        """Re-apply rent/return events logged after the last snapshot."""
+        log_path = self.__data_file + '.log'
+        if not os.path.exists(log_path):
+            return
+
+        events = []
+        try:
+            with open(log_path, 'rb') as log:
+                while True:
+                    try:
+                        events.append(pickle.load(log))
+                    except EOFError:
+                        break
+        except _PERSISTENCE_ERRORS as e:
+            print(f"Warning: Could not read event log: {e}")
+            return
+
+        self.__replaying = True
+        try:
+            # The per-event confirmations are noise at startup
+            import io
+            from contextlib import redirect_stdout
+            with redirect_stdout(io.StringIO()):
+                for event in events:
+                    if event.get('op') == 'rent':
+                        period = RentalPeriod(event['start_date'], event['end_date'],
+                                              allow_past_dates=True)
+                        self.rent_vehicles(event['vehicle_id'], event['renter_id'], period)
+                    elif event.get('op') == 'return':
+                        self.return_vehicle_with_date(event['vehicle_id'], event['renter_id'],
+                                                      event['return_date'])
+        finally:
+            self.__replaying = False
+
+        if events:
+            print(f"Replayed {len(events)} logged rental event(s).")
     
     def load_data(self) -> None:
         """
@@ -89,8 +267,14 @@ class VehicleRental:
                 print("No existing data file found. Starting with empty system.")
                 return
 
-            with open(self.__data_file, 'rb') as file:
-                data = pickle.load(file)
+            with open(self.__data_file, 'rb', buffering=1 << 20) as file:
+                # Sniff the gzip magic so compressed and raw files both load,
+                # whatever the current compress setting
+                if file.peek(2)[:2] == b'\x1f\x8b':
+                    with gzip.open(file) as decompressed:
+                        data = pickle.load(decompressed)
+                else:
+                    data = pickle.load(file)
 
             # Load vehicles
             if 'vehicles' in data and isinstance(data['vehicles'], list):
@@ -104,9 +288,13 @@ class VehicleRental:
             else:
                 self.__renters = []
 
-            # Load rental records
+            # Load rental records: current files hold compact field tuples,
+            # older ones hold pickled RentalRecord objects
             if 'rental_records' in data and isinstance(data['rental_records'], list):
-                self.__rental_records = data['rental_records']
+                self.__rental_records = [
+                    record if isinstance(record, RentalRecord) else RentalRecord._from_state(record)
+                    for record in data['rental_records']
+                ]
             else:
                 self.__rental_records = []
 
@@ -116,8 +304,33 @@ class VehicleRental:
             else:
                 self.__next_record_id = 1
 
+            # Rebuild the ID indexes for the freshly loaded lists
+            self.__vehicle_index = {v.get_vehicle_id(): v for v in self.__vehicles}
+            self.__renter_index = {r.get_renter_id(): r for r in self.__renters}
+
+            # Align the record indexes as well, so the first lookup after a
+            # load doesn't pay the full rebuild
+            self.__record_id_index = {r.get_record_id(): r for r in self.__rental_records}
+            self.__record_id_index_count = len(self.__rental_records)
+            self.__active_pair_index = {
+                (r.get_vehicle_id(), r.get_renter_id()): r
+                for r in self.__rental_records if r.is_active()
+            }
+            self.__active_pair_index_count = len(self.__rental_records)
+            self.__active_records = [r for r in self.__rental_records if r.is_active()]
+            self.__active_records_count = len(self.__rental_records)
+
+            # Rebuild the rented-ID set from the loaded vehicles
+            self.__currently_rented_ids = {
+                v.get_vehicle_id() for v in self.__vehicles if v.is_currently_rented()
+            }
+
             print(f"Data successfully loaded. {len(self.__vehicles)} vehicles, {len(self.__renters)} renters, and {len(self.__rental_records)} rental records.")
 
+            # Re-apply any rent/return events that never made it into a
+            # snapshot (e.g. the process died before a flush)
+            self._replay_event_log()
+
         except FileNotFoundError:
             print("Data file not found. Starting with empty system.")
         except (IOError, pickle.PickleError, EOFError) as e:
@@ -127,20 +340,49 @@ class VehicleRental:
             self.__renters = []
             self.__rental_records = []
             self.__next_record_id = 1
+            self.__vehicle_index = {}
+            self.__renter_index = {}
+            self.__currently_rented_ids = set()
     
+    def _get_vehicle_index(self) -> Dict[str, Vehicle]:
+        """Get the vehicle ID index, rebuilding it if the list was mutated externally."""
+        if len(self.__vehicle_index) != len(self.__vehicles):
+            self.__vehicle_index = {v.get_vehicle_id(): v for v in self.__vehicles}
+        return self.__vehicle_index
+
+    def _get_renter_index(self) -> Dict[str, Renter]:
+        """Get the renter ID index, rebuilding it if the list was mutated externally."""
+        if len(self.__renter_index) != len(self.__renters):
+            self.__renter_index = {r.get_renter_id(): r for r in self.__renters}
+        return self.__renter_index
+
+    def _get_vehicles_by_type(self) -> Dict[type, List[Vehicle]]:
+        """Get the vehicle type buckets, rebuilding them if the list was mutated externally."""
+        if self.__vehicles_by_type_count != len(self.__vehicles):
+            buckets: Dict[type, List[Vehicle]] = {}
+            for vehicle in self.__vehicles:
+                buckets.setdefault(type(vehicle), []).append(vehicle)
+            self.__vehicles_by_type = buckets
+            self.__vehicles_by_type_count = len(self.__vehicles)
+        return self.__vehicles_by_type
+
+    def _get_renters_by_type(self) -> Dict[type, List[Renter]]:
+        """Get the renter type buckets, rebuilding them if the list was mutated externally."""
+        if self.__renters_by_type_count != len(self.__renters):
+            buckets: Dict[type, List[Renter]] = {}
+            for renter in self.__renters:
+                buckets.setdefault(type(renter), []).append(renter)
+            self.__renters_by_type = buckets
+            self.__renters_by_type_count = len(self.__renters)
+        return self.__renters_by_type
+
     def _find_vehicle_by_id(self, vehicle_id: str) -> Optional[Vehicle]:
-        """Find a vehicle by its ID."""
-        for vehicle in self.__vehicles:
-            if vehicle.get_vehicle_id() == vehicle_id:
-                return vehicle
-        return None
-    
+        """Find a vehicle by its ID (O(1) dict lookup)."""
+        return self._get_vehicle_index().get(vehicle_id)
+
     def _find_renter_by_id(self, renter_id: str) -> Optional[Renter]:
-        """Find a renter by their ID."""
-        for renter in self.__renters:
-            if renter.get_renter_id() == renter_id:
-                return renter
-        return None
+        """Find a renter by their ID (O(1) dict lookup)."""
+        return self._get_renter_index().get(renter_id)
     
     def add_vehicles(self, vehicle: Vehicle) -> None:
         """
@@ -159,15 +401,16 @@ class VehicleRental:
         vehicle_id = vehicle.get_vehicle_id()
         if self._find_vehicle_by_id(vehicle_id) is not None:
             raise DuplicateVehicleError(vehicle_id)
-        
+
+        self.__vehicle_index[vehicle_id] = vehicle
+        self.__vehicles_by_type.setdefault(type(vehicle), []).append(vehicle)
+        self.__vehicles_by_type_count += 1
         self.__vehicles.append(vehicle)
         print(f"Vehicle {vehicle_id} ({vehicle.get_vehicle_type()}) added to the system.")
-        
-        # Auto-save after adding vehicle
-        try:
-            self.save_data()
-        except DataPersistenceError as e:
-            print(f"Warning: Could not save data after adding vehicle: {e}")
+
+        # Defer persistence: flush() writes once for a whole batch instead
+        # of re-pickling the full system after every insert
+        self.mark_dirty()
     
     def add_users(self, renter: Renter) -> None:
         """
@@ -186,15 +429,14 @@ class VehicleRental:
         renter_id = renter.get_renter_id()
         if self._find_renter_by_id(renter_id) is not None:
             raise DuplicateRenterError(renter_id)
-        
+
+        self.__renter_index[renter_id] = renter
+        self.__renters_by_type.setdefault(type(renter), []).append(renter)
+        self.__renters_by_type_count += 1
         self.__renters.append(renter)
         print(f"{renter.get_user_type()} user {renter.get_name()} (ID: {renter_id}) added to the system.")
-        
-        # Auto-save after adding renter
-        try:
-            self.save_data()
-        except DataPersistenceError as e:
-            print(f"Warning: Could not save data after adding renter: {e}")
+
+        self.mark_dirty()
     
     def rent_vehicles(self, vehicle_id: str, renter_id: str, rental_period: RentalPeriod) -> bool:
         """
@@ -249,28 +491,34 @@ class VehicleRental:
                 discount_applied=user_discount
             )
 
-            # Display rental confirmation
-            duration = rental_period.calculate_duration()
-            discount_pct = user_discount * 100
-            
-            print(f"\n{'='*60}")
-            print(f"RENTAL CONFIRMATION")
-            print(f"{'='*60}")
-            print(f"Vehicle ID: {vehicle.get_vehicle_id()}")
-            print(f"Vehicle: {vehicle.get_year()} {vehicle.get_make()} {vehicle.get_model()} ({vehicle.get_vehicle_type()})")
-            print(f"Renter: {renter.get_name()} ({renter.get_user_type()})")
-            print(f"Period: {rental_period.get_start_date()} to {rental_period.get_end_date()}")
-            print(f"Duration: {duration} days")
-            print(f"Discount Applied: {discount_pct:.1f}%")
-            print(f"Total Cost: ${rental_cost:.2f}")
-            print(f"{'='*60}")
-            
-            # Auto-save after successful rental
-            try:
-                self.save_data()
-            except DataPersistenceError as e:
-                print(f"Warning: Could not save data after rental: {e}")
-            
+            # Display rental confirmation in one write
+            print(_RENTAL_CONFIRMATION_TEMPLATE.format(
+                vehicle_id=vehicle.get_vehicle_id(),
+                year=vehicle.get_year(),
+                make=vehicle.get_make(),
+                model=vehicle.get_model(),
+                vehicle_type=vehicle.get_vehicle_type(),
+                renter_name=renter.get_name(),
+                user_type=renter.get_user_type(),
+                start_date=rental_period.get_start_date(),
+                end_date=rental_period.get_end_date(),
+                duration=rental_period.calculate_duration(),
+                discount_pct=user_discount * 100,
+                rental_cost=rental_cost,
+            ))
+
+            # Log the event, then persist lazily; the request teardown (or
+            # cleanup_and_exit) flushes the batch
+            self._append_event({
+                'op': 'rent',
+                'vehicle_id': vehicle_id,
+                'renter_id': renter_id,
+                'start_date': rental_period.get_start_date(),
+                'end_date': rental_period.get_end_date(),
+            })
+            self.__currently_rented_ids.add(vehicle_id)
+            self.mark_dirty()
+
             return True
             
         except (VehicleNotFoundError, RenterNotFoundError, VehicleNotAvailableError) as e:
@@ -308,14 +556,8 @@ class VehicleRental:
             if not vehicle.is_currently_rented():
                 raise VehicleAlreadyReturnedError(vehicle_id)
 
-            # Find the active rental record
-            active_record = None
-            for record in self.__rental_records:
-                if (record.get_vehicle_id() == vehicle_id and
-                    record.get_renter_id() == renter_id and
-                    record.is_active()):
-                    active_record = record
-                    break
+            # Find the active rental record via the pair index
+            active_record = self.find_active_rental_record(vehicle_id, renter_id)
 
             if not active_record:
                 return {
@@ -400,11 +642,38 @@ class VehicleRental:
             # Update rental record
             active_record.process_return(return_date, final_cost, return_type)
 
-            # Auto-save
-            try:
-                self.save_data()
-            except DataPersistenceError as e:
-                print(f"Warning: Could not save data after return: {e}")
+            # The record is no longer active: drop it from the active indexes
+            self.__active_pair_index.pop((vehicle_id, renter_id), None)
+            if active_record in self.__active_records:
+                self.__active_records.remove(active_record)
+
+            # Persist the computed summary so invoice views can replay it
+            active_record.set_return_summary({
+                'return_type': return_type,
+                'scheduled_end_date': active_record.get_end_date(),
+                'actual_return_date': return_date,
+                'scheduled_days': scheduled_days,
+                'actual_days': actual_days,
+                'original_cost': original_total_cost,
+                'final_cost': final_cost,
+                'penalty': penalty,
+                'refund': refund,
+                'message': message,
+            })
+
+            # Log the event, then persist lazily; the request teardown (or
+            # cleanup_and_exit) flushes the batch
+            self._append_event({
+                'op': 'return',
+                'vehicle_id': vehicle_id,
+                'renter_id': renter_id,
+                'return_date': return_date,
+            })
+            # The vehicle may still hold other active bookings, so only
+            # drop it from the rented set once none remain
+            if not vehicle.is_currently_rented():
+                self.__currently_rented_ids.discard(vehicle_id)
+            self.mark_dirty()
 
             # Return success with details
             return {
@@ -443,69 +712,91 @@ class VehicleRental:
         result = self.return_vehicle_with_date(vehicle_id, renter_id, rental_period.get_end_date())
         return result.get('success', False)
     
+    @staticmethod
+    def _emit(lines: List[str]) -> None:
+        """
+        Write accumulated display lines to stdout in a single call.
+
+        The display methods used to print() line by line, paying a stream
+        lock and flush per row; joining once writes the whole listing in
+        one go.
+        """
+        sys.stdout.write('\n'.join(lines) + '\n')
+
     def display_available_vehicles(self) -> None:
         """Display all available vehicles in the system."""
-        available_vehicles = [v for v in self.__vehicles if not v.is_currently_rented()]
-        
-        if not available_vehicles:
+        rented_ids = self.__currently_rented_ids
+
+        # Deferred import: the concrete classes are only needed to key the
+        # buckets here, so module startup skips their import graphs and
+        # repeat calls resolve them from sys.modules
+        from car import Car
+        from motorbike import Motorbike
+        from truck import Truck
+
+        # The insert-time type buckets already hold each class together, so
+        # grouping is three bucket reads instead of three isinstance scans
+        buckets = self._get_vehicles_by_type()
+        cars = [v for v in buckets.get(Car, ()) if v.get_vehicle_id() not in rented_ids]
+        motorbikes = [v for v in buckets.get(Motorbike, ()) if v.get_vehicle_id() not in rented_ids]
+        trucks = [v for v in buckets.get(Truck, ()) if v.get_vehicle_id() not in rented_ids]
+
+        total_available = len(cars) + len(motorbikes) + len(trucks)
+        if not total_available:
             print("\nNo available vehicles in the system.")
             return
-        
-        print(f"\n{'='*80}")
-        print(f"AVAILABLE VEHICLES ({len(available_vehicles)} total)")
-        print(f"{'='*80}")
-        
-        # Group by vehicle type
-        cars = [v for v in available_vehicles if isinstance(v, Car)]
-        motorbikes = [v for v in available_vehicles if isinstance(v, Motorbike)]
-        trucks = [v for v in available_vehicles if isinstance(v, Truck)]
-        
+
+        lines = [f"\n{'='*80}",
+                 f"AVAILABLE VEHICLES ({total_available} total)",
+                 '=' * 80]
+
         for vehicle_type, vehicles in [("CARS", cars), ("MOTORBIKES", motorbikes), ("TRUCKS", trucks)]:
             if vehicles:
-                print(f"\n{vehicle_type}:")
-                print("-" * 40)
+                lines.append(f"\n{vehicle_type}:")
+                lines.append("-" * 40)
                 for vehicle in vehicles:
-                    print(f"  {vehicle}")
+                    lines.append(f"  {vehicle}")
+
+        self._emit(lines)
     
     def display_vehicles_on_rent(self) -> None:
         """Display all currently rented vehicles with rental information."""
-        rented_vehicles = [v for v in self.__vehicles if v.is_currently_rented()]
+        rented_ids = self.__currently_rented_ids
+        rented_vehicles = [v for v in self.__vehicles if v.get_vehicle_id() in rented_ids]
         
         if not rented_vehicles:
             print("\nNo vehicles currently rented.")
             return
         
-        print(f"\n{'='*80}")
-        print(f"RENTED VEHICLES ({len(rented_vehicles)} total)")
-        print(f"{'='*80}")
-        
+        lines = [f"\n{'='*80}",
+                 f"RENTED VEHICLES ({len(rented_vehicles)} total)",
+                 '=' * 80]
+
+
+        # One pass over every renter's current rentals builds a lookup keyed
+        # by (vehicle_id, start_date, end_date); each displayed period then
+        # resolves its renter and cost with a single dict hit instead of the
+        # old renter x rentals rescans per period
+        renter_lookup = {}
+        for renter in self.__renters:
+            for rental in renter.get_current_rentals():
+                renter_lookup[(rental['vehicle_id'], rental['start_date'],
+                               rental['end_date'])] = (renter, rental['cost'])
+
         for vehicle in rented_vehicles:
-            print(f"\n{vehicle}")
-            rental_periods = vehicle.get_rental_periods()
-            
-            for period in rental_periods:
-                # Find the renter for this period
-                renter = None
-                for r in self.__renters:
-                    for rental in r.get_current_rentals():
-                        if (rental['vehicle_id'] == vehicle.get_vehicle_id() and
-                            rental['start_date'] == period['start_date'] and
-                            rental['end_date'] == period['end_date']):
-                            renter = r
-                            break
-                    if renter:
-                        break
-                
-                if renter:
-                    print(f"  Rented to: {renter.get_name()} ({renter.get_user_type()})")
-                    print(f"  Period: {period['start_date']} to {period['end_date']}")
-                    # Find rental cost from renter's records
-                    for rental in renter.get_current_rentals():
-                        if (rental['vehicle_id'] == vehicle.get_vehicle_id() and
-                            rental['start_date'] == period['start_date']):
-                            print(f"  Cost: ${rental['cost']:.2f}")
-                            break
-                print("-" * 50)
+            lines.append(f"\n{vehicle}")
+            vehicle_id = vehicle.get_vehicle_id()
+
+            for period in vehicle.get_rental_periods():
+                entry = renter_lookup.get((vehicle_id, period['start_date'], period['end_date']))
+                if entry is not None:
+                    renter, cost = entry
+                    lines.append(f"  Rented to: {renter.get_name()} ({renter.get_user_type()})")
+                    lines.append(f"  Period: {period['start_date']} to {period['end_date']}")
+                    lines.append(f"  Cost: ${cost:.2f}")
+                lines.append("-" * 50)
+
+        self._emit(lines)
     
     def display_users(self) -> None:
         """Display all users in the system."""
@@ -513,25 +804,32 @@ class VehicleRental:
             print("\nNo users in the system.")
             return
         
-        print(f"\n{'='*80}")
-        print(f"ALL USERS ({len(self.__renters)} total)")
-        print(f"{'='*80}")
-        
-        # Group by user type
-        individuals = [r for r in self.__renters if isinstance(r, IndividualUser)]
-        corporates = [r for r in self.__renters if isinstance(r, CorporateUser)]
-        
+        lines = [f"\n{'='*80}",
+                 f"ALL USERS ({len(self.__renters)} total)",
+                 '=' * 80]
+
+        # Deferred import, as in display_available_vehicles
+        from individual_user import IndividualUser
+        from corporate_user import CorporateUser
+
+        # Group by user type via the insert-time buckets
+        buckets = self._get_renters_by_type()
+        individuals = buckets.get(IndividualUser, [])
+        corporates = buckets.get(CorporateUser, [])
+
         if individuals:
-            print(f"\nINDIVIDUAL USERS ({len(individuals)}):")
-            print("-" * 50)
+            lines.append(f"\nINDIVIDUAL USERS ({len(individuals)}):")
+            lines.append("-" * 50)
             for renter in individuals:
-                print(f"  {renter}")
-        
+                lines.append(f"  {renter}")
+
         if corporates:
-            print(f"\nCORPORATE USERS ({len(corporates)}):")
-            print("-" * 50)
+            lines.append(f"\nCORPORATE USERS ({len(corporates)}):")
+            lines.append("-" * 50)
             for renter in corporates:
-                print(f"  {renter}")
+                lines.append(f"  {renter}")
+
+        self._emit(lines)
     
     def get_vehicles(self) -> List[Vehicle]:
         """Get a copy of the vehicles list."""
@@ -544,6 +842,57 @@ class VehicleRental:
     def get_rental_records(self) -> List[RentalRecord]:
         """Get a copy of all rental records."""
         return self.__rental_records.copy()
+
+    def view_vehicles(self) -> List[Vehicle]:
+        """
+        Get the internal vehicles list without copying.
+
+        For read-only consumers (e.g. rendering listing pages); callers
+        must not mutate the returned list.
+        """
+        return self.__vehicles
+
+    def view_renters(self) -> List[Renter]:
+        """
+        Get the internal renters list without copying.
+
+        For read-only consumers; callers must not mutate the returned list.
+        """
+        return self.__renters
+
+    def view_rental_records(self) -> List[RentalRecord]:
+        """
+        Get the internal rental records list without copying.
+
+        For read-only consumers (e.g. rendering the staff history page);
+        callers must not mutate the returned list.
+        """
+        return self.__rental_records
+
+    def get_rental_table_rows(self) -> List[dict]:
+        """
+        Build plain display rows for rental listings, newest first.
+
+        Precomputing the row dicts here keeps per-cell getter dispatch out
+        of the template loop when rendering large histories.
+        """
+        rows = []
+        for record in reversed(self.__rental_records):
+            actual_return = record.get_actual_return_date()
+            rows.append({
+                'record_id': record.get_record_id(),
+                'vehicle_id': record.get_vehicle_id(),
+                'renter_id': record.get_renter_id(),
+                'start_date': record.get_start_date(),
+                'end_date': record.get_end_date(),
+                'actual_return_date': actual_return,
+                'days': record.calculate_actual_duration() if actual_return else record.calculate_duration(),
+                'rental_cost': record.get_rental_cost(),
+                'final_cost': record.get_final_cost(),
+                'status': record.get_status(),
+                'return_type': record.get_return_type(),
+            })
+        return rows
     
     def add_rental_record(self, vehicle_id: str, renter_id: str, start_date: str, 
                          end_date: str, rental_cost: float, discount_applied: float = 0.0) -> RentalRecord:
@@ -575,27 +924,89 @@ class VehicleRental:
             discount_applied=discount_applied
         )
         
+        # Keep the secondary indexes in step with the append
+        self.__record_id_index[record_id] = rental_record
+        self.__record_id_index_count += 1
+        self.__active_pair_index[(vehicle_id, renter_id)] = rental_record
+        self.__active_pair_index_count += 1
+        self._get_active_records().append(rental_record)
+        self.__active_records_count += 1
+        self._get_records_by_vehicle_index().setdefault(vehicle_id, []).append(rental_record)
+        self.__records_by_vehicle_count += 1
+        self._get_records_by_renter_index().setdefault(renter_id, []).append(rental_record)
+        self.__records_by_renter_count += 1
+
         self.__rental_records.append(rental_record)
         return rental_record
     
+    def _get_records_by_vehicle_index(self) -> Dict[str, List[RentalRecord]]:
+        """Get the vehicle ID -> records index, rebuilding it if records changed."""
+        if self.__records_by_vehicle_count != len(self.__rental_records):
+            index: Dict[str, List[RentalRecord]] = {}
+            for record in self.__rental_records:
+                index.setdefault(record.get_vehicle_id(), []).append(record)
+            self.__records_by_vehicle = index
+            self.__records_by_vehicle_count = len(self.__rental_records)
+        return self.__records_by_vehicle
+
+    def _get_records_by_renter_index(self) -> Dict[str, List[RentalRecord]]:
+        """Get the renter ID -> records index, rebuilding it if records changed."""
+        if self.__records_by_renter_count != len(self.__rental_records):
+            index: Dict[str, List[RentalRecord]] = {}
+            for record in self.__rental_records:
+                index.setdefault(record.get_renter_id(), []).append(record)
+            self.__records_by_renter = index
+            self.__records_by_renter_count = len(self.__rental_records)
+        return self.__records_by_renter
+
     def get_rental_records_by_vehicle(self, vehicle_id: str) -> List[RentalRecord]:
         """Get all rental records for a specific vehicle."""
-        return [r for r in self.__rental_records if r.get_vehicle_id() == vehicle_id]
-    
+        return self._get_records_by_vehicle_index().get(vehicle_id, []).copy()
+
     def get_rental_records_by_renter(self, renter_id: str) -> List[RentalRecord]:
         """Get all rental records for a specific renter."""
-        return [r for r in self.__rental_records if r.get_renter_id() == renter_id]
+        return self._get_records_by_renter_index().get(renter_id, []).copy()
+
+    def iter_rental_records_by_renter(self, renter_id: str):
+        """Yield rental records for a renter without materializing a copy."""
+        yield from self._get_records_by_renter_index().get(renter_id, ())
     
+    def _get_active_records(self) -> List[RentalRecord]:
+        """Get the active-records list, rebuilding it if records changed underneath."""
+        if self.__active_records_count != len(self.__rental_records):
+            self.__active_records = [r for r in self.__rental_records if r.is_active()]
+            self.__active_records_count = len(self.__rental_records)
+        return self.__active_records
+
     def get_active_rental_records(self) -> List[RentalRecord]:
         """Get all currently active rental records."""
-        return [r for r in self.__rental_records if r.is_active()]
-    
+        return self._get_active_records().copy()
+
+
+    def _get_record_id_index(self) -> Dict[str, RentalRecord]:
+        """Get the record ID index, rebuilding it if the records list changed."""
+        if self.__record_id_index_count != len(self.__rental_records):
+            self.__record_id_index = {r.get_record_id(): r for r in self.__rental_records}
+            self.__record_id_index_count = len(self.__rental_records)
+        return self.__record_id_index
+
+    def _get_active_pair_index(self) -> Dict[Tuple[str, str], RentalRecord]:
+        """Get the (vehicle_id, renter_id) -> active record index."""
+        if self.__active_pair_index_count != len(self.__rental_records):
+            self.__active_pair_index = {
+                (r.get_vehicle_id(), r.get_renter_id()): r
+                for r in self.__rental_records if r.is_active()
+            }
+            self.__active_pair_index_count = len(self.__rental_records)
+        return self.__active_pair_index
+
     def find_rental_record_by_id(self, record_id: str) -> Optional[RentalRecord]:
-        """Find a rental record by its ID."""
-        for record in self.__rental_records:
-            if record.get_record_id() == record_id:
-                return record
-        return None
+        """Find a rental record by its ID (O(1) dict lookup)."""
+        return self._get_record_id_index().get(record_id)
+
+    def find_active_rental_record(self, vehicle_id: str, renter_id: str) -> Optional[RentalRecord]:
+        """Find the active rental record for a vehicle/renter pair, if any."""
+        return self._get_active_pair_index().get((vehicle_id, renter_id))
     
     def authenticate_user(self, renter_id: str, password: str) -> Optional[Renter]:
         """
@@ -614,17 +1025,10 @@ class VehicleRental:
         return None
     
     def cleanup_and_exit(self) -> None:
-        """Perform cleanup operations and save data before exiting."""
+        """Perform cleanup operations and save any unsaved data before exiting."""
         try:
             print("\nPerforming final data save...")
-            self.save_data()
+            self.flush()
             print("System shutdown complete.")
         except DataPersistenceError as e:
-            print(f"Error during final save: {e}")
-    
-    def __del__(self) -> None:
-        """Destructor to ensure data is saved when object is destroyed."""
-        try:
-            self.save_data()
-        except:
-            pass  # Avoid exceptions during destruction
\ No newline at end of file
+            print(f"Error during final save: {e}")
\ No newline at end of file
@@ -6,6 +6,7 @@ This module initializes and runs the Flask web application.
 
 import sys
 import os
+from pathlib import Path
 
 # IMPORTANT: Get the absolute directory where THIS script is located
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -16,21 +17,27 @@ sys.path.insert(0, BASE_DIR)
 # Change working directory to script location to ensure correct path resolution
 os.chdir(BASE_DIR)
 
+# App paths assembled exactly once at import, as module-level constants;
+# everything below reuses them instead of re-joining the pieces
+TEMPLATES_FOLDER = str(Path(BASE_DIR) / 'templates')
+STATIC_FOLDER = str(Path(BASE_DIR) / 'static')
+UPLOAD_FOLDER = str(Path(BASE_DIR) / 'static' / 'images' / 'vehicles')
+
 print(f"[DEBUG] Working Directory: {os.getcwd()}")
 print(f"[DEBUG] Base Directory: {BASE_DIR}")
-print(f"[DEBUG] Templates Directory: {os.path.join(BASE_DIR, 'templates')}")
+print(f"[DEBUG] Templates Directory: {TEMPLATES_FOLDER}")
 
 from flask import Flask
 from controllers.routes import init_routes
 
 # Create Flask app with ABSOLUTE paths
 app = Flask(__name__,
-            template_folder=os.path.join(BASE_DIR, 'templates'),
-            static_folder=os.path.join(BASE_DIR, 'static'))
+            template_folder=TEMPLATES_FOLDER,
+            static_folder=STATIC_FOLDER)
 app.secret_key = 'vehicle_rental_secret_key_2025'  # For session management
 
 # Configure upload folder for vehicle images (use absolute path)
-app.config['UPLOAD_FOLDER'] = os.path.join(BASE_DIR, 'static', 'images', 'vehicles')
+app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
 # Initialize routes
@@ -38,7 +45,7 @@ init_routes(app)
 
 if __name__ == '__main__':
     # Create upload folder if it doesn't exist
-    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
     
     # Run the application
     print("="*60)
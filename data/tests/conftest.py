@@ -0,0 +1,38 @@
+"""
+Shared pytest configuration for the test suite.
+
+Puts the models directory on sys.path once per session, before any test
+module is imported, so every test file can import the flat model modules
+directly instead of repeating the path setup.
+"""
+
+import copy
+import functools
+import os
+import sys
+
+import pytest
+
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+_models_path = os.path.join(os.path.dirname(_current_dir), 'models')
+
+if _models_path not in sys.path:
+    sys.path.insert(0, _models_path)
+
+import importlib
+vehicle_rental = importlib.import_module('vehicle_rental')
+
+
+@functools.lru_cache(maxsize=4)
+def _system_prototype(data_file=':memory:'):
+    """Construct one pristine VehicleRental per data file; fixtures copy it."""
+    return vehicle_rental.VehicleRental(data_file)
+
+
+@pytest.fixture
+def fresh_system():
+    """A private, fully initialized in-memory system.
+
+    Deep-copying the cached prototype hands each test an isolated
+    instance without re-running __init__ per test."""
+    return copy.deepcopy(_system_prototype())
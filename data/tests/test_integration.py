@@ -4,18 +4,8 @@ Tests end-to-end workflows: login → rent → return
 """
 
 import pytest
-import sys
-import os
 
-# Add models directory to Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_dir)
-models_path = os.path.join(project_root, 'models')
-
-if models_path not in sys.path:
-    sys.path.insert(0, models_path)
-
-# Import from models directory
+# Import from models directory (conftest.py puts it on sys.path)
 import importlib
 
 def _import_module_with_fallback(names):
@@ -56,15 +46,15 @@ StaffUser = staff_user.StaffUser
 Car = car.Car
 RentalPeriod = rental_period.RentalPeriod
 
+# End-to-end flows; deferred by `pytest -m "not slow"` during tight edit loops
+pytestmark = pytest.mark.slow
+
 
 @pytest.fixture
-def full_system():
+def full_system(fresh_system):
     """Complete system with users and vehicles."""
-    system = VehicleRental("integration_test.pkl")
-    system._VehicleRental__vehicles = []
-    system._VehicleRental__renters = []
-    system._VehicleRental__rental_records = []
-    
+    system = fresh_system
+
     # Add users
     system.add_users(IndividualUser("I001", "John", "john@test.com", "01-01-1990", "DL123", "pass123"))
     system.add_users(CorporateUser("CO001", "Alice", "alice@corp.com", "Corp", "CR123", "123 Main Street, Auckland", "pass123"))
@@ -73,8 +63,9 @@ def full_system():
     # Add vehicles
     system.add_vehicles(Car("CAR001", "Toyota", "Camry", 2022, 65.0, 4, "Petrol", "Automatic"))
     system.add_vehicles(Car("CAR002", "Tesla", "Model 3", 2023, 95.0, 4, "Electric", "Automatic"))
-    
-    return system
+
+    yield system
+    system.flush()
 
 
 # ===== END-TO-END RENTAL WORKFLOW =====
@@ -3,19 +3,10 @@ Unit Tests
 Tests: User authentication, Discount calculation, Rental logic
 """
 
+import copy
 import pytest
-import sys
-import os
 
-# Add models directory to Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_dir)
-models_path = os.path.join(project_root, 'models')
-
-if models_path not in sys.path:
-    sys.path.insert(0, models_path)
-
-# Import from models directory
+# Import from models directory (conftest.py puts it on sys.path)
 import importlib
 vehicle_rental = importlib.import_module('vehicle_rental')
 individual_user = importlib.import_module('individual_user')
@@ -31,145 +22,148 @@ StaffUser = staff_user.StaffUser
 Car = car.Car
 RentalPeriod = rental_period.RentalPeriod
 
+# Fast in-memory tests; `pytest -m unit` runs just this file's lane
+pytestmark = pytest.mark.unit
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def system():
-    """Fresh rental system for each test."""
-    s = VehicleRental("test_data.pkl")
-    s._VehicleRental__vehicles = []
-    s._VehicleRental__renters = []
-    s._VehicleRental__rental_records = []
-    return s
+    """Single rental system shared across the suite; built (and its data
+    file loaded) once instead of once per test."""
+    s = VehicleRental(":memory:")
+    yield s
+    s.flush()
 
 
-# ===== USER AUTHENTICATION TESTS =====
-def test_individual_login(system):
-    """Test individual user can login."""
-    user = IndividualUser("I001", "John", "john@test.com", "01-01-1990", "DL123", "pass123")
-    system.add_users(user)
-    auth_user = system.authenticate_user("I001", "pass123")
-    assert auth_user is not None
-    assert auth_user.get_renter_id() == "I001"
+@pytest.fixture(autouse=True)
+def _reset_system(system):
+    """Wipe the shared system's state in place before each test."""
+    system.reset()
+    yield
 
 
-def test_corporate_login(system):
-    """Test corporate user can login."""
-    user = CorporateUser("C001", "Alice", "alice@corp.com", "Corp", "CR123", "123 Main Street, Auckland", "pass123")
-    system.add_users(user)
-    auth_user = system.authenticate_user("C001", "pass123")
-    assert auth_user is not None
+# Canonical constructor args, defined once and reused by the fixtures and
+# the parametrize tables below
+INDIVIDUAL_ARGS = ("I001", "John", "john@test.com", "01-01-1990", "DL123", "pass123")
+CORPORATE_ARGS = ("C001", "Alice", "alice@corp.com", "Corp", "CR123", "123 Main Street, Auckland", "pass123")
+STAFF_ARGS = ("S001", "Admin", "admin@test.com", "EMP-001", "Admin", "pass123")
 
 
-def test_staff_login(system):
-    """Test staff user can login."""
-    user = StaffUser("S001", "Admin", "admin@test.com", "EMP-001", "Admin", "pass123")
-    system.add_users(user)
-    auth_user = system.authenticate_user("S001", "pass123")
-    assert auth_user is not None
+# Canonical test objects validated once per module; each test gets its own
+# deep copy so rental state never leaks between tests
+@pytest.fixture(scope="module")
+def _user_template():
+    return IndividualUser(*INDIVIDUAL_ARGS)
 
 
-def test_wrong_password(system):
-    """Test login fails with wrong password."""
-    user = IndividualUser("I001", "John", "john@test.com", "01-01-1990", "DL123", "pass123")
-    system.add_users(user)
-    auth_user = system.authenticate_user("I001", "wrongpass")
-    assert auth_user is None
+@pytest.fixture
+def user(request, _user_template):
+    """Fresh copy of the canonical individual user.
 
+    Tests needing different constructor args can supply their own tuple
+    via @pytest.mark.parametrize("user", [...], indirect=True)."""
+    if hasattr(request, "param"):
+        return IndividualUser(*request.param)
+    return copy.deepcopy(_user_template)
 
-# ===== DISCOUNT CALCULATION TESTS =====
-def test_individual_no_discount_short():
-    """Individual user: no discount for rental < 7 days."""
-    user = IndividualUser("I001", "John", "john@test.com", "01-01-1990", "DL123", "pass123")
-    period = RentalPeriod("01-01-2026", "05-01-2026")  # 5 days
-    discount = user.calculate_discount(period)
-    assert discount == 0.0
 
+@pytest.fixture(scope="module")
+def _car_template():
+    return Car("C001", "Toyota", "Camry", 2022, 65.0, 4, "Petrol", "Automatic")
 
-def test_individual_discount_long():
-    """Individual user: 10% discount for rental >= 7 days."""
-    user = IndividualUser("I001", "John", "john@test.com", "01-01-1990", "DL123", "pass123")
-    period = RentalPeriod("01-01-2026", "10-01-2026")  # 10 days
-    discount = user.calculate_discount(period)
-    assert discount == 0.10  # 10%
 
+@pytest.fixture
+def car(_car_template):
+    """Fresh copy of the canonical car."""
+    return copy.deepcopy(_car_template)
 
-def test_corporate_discount():
-    """Corporate user: always 15% discount."""
-    user = CorporateUser("C001", "Alice", "alice@corp.com", "Corp", "CR123", "123 Main Street, Auckland", "pass123")
-    period = RentalPeriod("01-01-2026", "05-01-2026")  # any days
-    discount = user.calculate_discount(period)
-    assert discount == 0.15  # 15%
 
+@pytest.fixture(scope="module")
+def period_5d():
+    """The 5-day rental window shared by the rental-logic tests.
 
-def test_staff_no_discount():
-    """Staff user: no discount."""
-    user = StaffUser("S001", "Admin", "admin@test.com", "EMP-001", "Admin", "pass123")
-    period = RentalPeriod("01-01-2026", "10-01-2026")
-    discount = user.calculate_discount(period)
-    assert discount == 0.0
+    Module-scoped: the tests only read it, so the date parsing happens
+    once instead of per test."""
+    return RentalPeriod("01-01-2026", "05-01-2026")
 
 
-# ===== RENTAL LOGIC TESTS =====
-def test_rent_available_vehicle(system):
-    """Test renting an available vehicle."""
-    car = Car("C001", "Toyota", "Camry", 2022, 65.0, 4, "Petrol", "Automatic")
-    user = IndividualUser("I001", "John", "john@test.com", "01-01-1990", "DL123", "pass123")
-    system.add_vehicles(car)
+# ===== USER AUTHENTICATION TESTS =====
+@pytest.mark.parametrize("user", [
+    IndividualUser(*INDIVIDUAL_ARGS),
+    CorporateUser(*CORPORATE_ARGS),
+    StaffUser(*STAFF_ARGS),
+], ids=["individual", "corporate", "staff"])
+def test_login(system, user):
+    """Each user type can log in with the right password."""
     system.add_users(user)
-    
-    period = RentalPeriod("01-01-2026", "05-01-2026")
-    success = system.rent_vehicles("C001", "I001", period)
-    
-    assert success is True
-    assert car.is_currently_rented() is True
+    auth_user = system.authenticate_user(user.get_renter_id(), "pass123")
+    assert auth_user is not None
+    assert auth_user.get_renter_id() == user.get_renter_id()
 
 
-def test_return_vehicle(system):
-    """Test returning a rented vehicle."""
-    car = Car("C001", "Toyota", "Camry", 2022, 65.0, 4, "Petrol", "Automatic")
-    user = IndividualUser("I001", "John", "john@test.com", "01-01-1990", "DL123", "pass123")
-    system.add_vehicles(car)
+def test_wrong_password(system, user):
+    """Test login fails with wrong password."""
     system.add_users(user)
-    
-    period = RentalPeriod("01-01-2026", "05-01-2026")
-    system.rent_vehicles("C001", "I001", period)
-    success = system.return_vehicles("C001", "I001", period)
-    
-    assert success is True
-    assert car.is_currently_rented() is False
+    auth_user = system.authenticate_user("I001", "wrongpass")
+    assert auth_user is None
 
 
-def test_rental_cost_calculation(system):
-    """Test rental cost is calculated correctly."""
-    car = Car("C001", "Toyota", "Camry", 2022, 65.0, 4, "Petrol", "Automatic")
-    user = IndividualUser("I001", "John", "john@test.com", "01-01-1990", "DL123", "pass123")
+# ===== DISCOUNT CALCULATION TESTS =====
+@pytest.mark.parametrize("user_factory, period_args, expected", [
+    (lambda: IndividualUser(*INDIVIDUAL_ARGS),
+     ("01-01-2026", "05-01-2026"), 0.0),    # 5 days: no discount
+    (lambda: IndividualUser(*INDIVIDUAL_ARGS),
+     ("01-01-2026", "10-01-2026"), 0.10),   # 10 days: 10% discount
+    (lambda: CorporateUser(*CORPORATE_ARGS),
+     ("01-01-2026", "05-01-2026"), 0.15),   # corporate: always 15%
+    (lambda: StaffUser(*STAFF_ARGS),
+     ("01-01-2026", "10-01-2026"), 0.0),    # staff: never discounted
+], ids=["individual_short", "individual_long", "corporate", "staff"])
+def test_discount(user_factory, period_args, expected):
+    """Each user type applies its own discount rule to a rental period."""
+    user = user_factory()
+    period = RentalPeriod(*period_args)
+    assert user.calculate_discount(period) == expected
+
+
+# ===== RENTAL LOGIC TESTS =====
+@pytest.mark.slow
+@pytest.mark.parametrize("do_return, expected_rented", [
+    (False, True),
+    (True, False),
+], ids=["rent", "rent_then_return"])
+def test_rental_lifecycle(system, car, user, period_5d, do_return, expected_rented):
+    """Renting marks the vehicle rented; returning makes it available again."""
     system.add_vehicles(car)
     system.add_users(user)
-    
-    period = RentalPeriod("01-01-2026", "05-01-2026")  # 5 days (inclusive)
-    system.rent_vehicles("C001", "I001", period)
-    
-    user_rentals = user.get_current_rentals()
-    assert len(user_rentals) > 0
-    # 5 days * $65 = $325.00
-    assert user_rentals[0]['cost'] == 325.00
-
 
-def test_rental_with_corporate_discount(system):
-    """Test rental cost includes corporate discount."""
-    car = Car("C001", "Toyota", "Camry", 2022, 65.0, 4, "Petrol", "Automatic")
-    user = CorporateUser("CO001", "Alice", "alice@corp.com", "Corp", "CR123", "123 Main Street, Auckland", "pass123")
+    success = system.rent_vehicles("C001", "I001", period_5d)
+    assert success is True
+    if do_return:
+        success = system.return_vehicles("C001", "I001", period_5d)
+        assert success is True
+
+    assert car.is_currently_rented() is expected_rented
+
+
+@pytest.mark.parametrize("user_factory, expected_cost", [
+    (lambda: IndividualUser(*INDIVIDUAL_ARGS),
+     325.00),          # 5 days * $65, no discount under 7 days
+    (lambda: CorporateUser(*CORPORATE_ARGS),
+     325.00 * 0.85),   # 15% corporate discount -> $276.25
+], ids=["individual", "corporate"])
+@pytest.mark.slow
+def test_rental_cost(system, car, period_5d, user_factory, expected_cost):
+    """The recorded rental cost reflects the renter's discount tier."""
+    user = user_factory()
     system.add_vehicles(car)
     system.add_users(user)
 
-    period = RentalPeriod("01-01-2026", "05-01-2026")  # 5 days
-    system.rent_vehicles("C001", "CO001", period)
+    system.rent_vehicles(car.get_vehicle_id(), user.get_renter_id(), period_5d)
 
     user_rentals = user.get_current_rentals()
-    # 5 days * $65 * 0.85 (15% corporate discount)
-    base = 325.0
-    final_cost = base * 0.85  # $276.25 after 15% discount
-    assert abs(user_rentals[0]['cost'] - final_cost) < 0.01
+    assert len(user_rentals) > 0
+    assert user_rentals[0]['cost'] == pytest.approx(expected_cost, abs=0.01)
 
 
 if __name__ == "__main__":
@@ -46,7 +46,10 @@ class RentalPeriod:
             # Store original string format for display
             self.__start_date = start_date
             self.__end_date = end_date
-            
+
+            # Duration never changes unless a setter runs, so compute it once
+            self.__duration = (self.__end_date_obj - self.__start_date_obj).days + 1
+
         except ValueError as e:
             if "InvalidRentalPeriodError" not in str(e):
                 raise InvalidRentalPeriodError(start_date, end_date, str(e))
@@ -104,6 +107,7 @@ class RentalPeriod:
         
         self.__start_date = start_date
         self.__start_date_obj = new_start_obj
+        self.__duration = (self.__end_date_obj - self.__start_date_obj).days + 1
     
     def set_end_date(self, end_date: str, allow_past_dates: bool = False) -> None:
         """Set the end date of the rental period."""
@@ -113,11 +117,16 @@ class RentalPeriod:
         
         self.__end_date = end_date
         self.__end_date_obj = new_end_obj
+        self.__duration = (self.__end_date_obj - self.__start_date_obj).days + 1
     
     def calculate_duration(self) -> int:
         """Calculate the duration of the rental period in days."""
-        duration = (self.__end_date_obj - self.__start_date_obj).days + 1
-        return duration
+        try:
+            return self.__duration
+        except AttributeError:
+            # Periods unpickled from older data files predate the cached value
+            self.__duration = (self.__end_date_obj - self.__start_date_obj).days + 1
+            return self.__duration
     
     def overlaps_with(self, other: 'RentalPeriod') -> bool:
         """
@@ -7,7 +7,7 @@ attributes and methods that all users must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
 from rental_period import RentalPeriod
 from exceptions import InvalidRenterDataError
 import re
@@ -40,8 +40,9 @@ class Renter(ABC):
         self.__contact_info = self._validate_contact_info(contact_info)
         self.__password = password  # In production, this should be hashed
         
-        # Rental management
-        self.__current_rentals: List[Dict] = []
+        # Rental management (current rentals keyed by (vehicle_id, start_date,
+        # end_date) so multiple non-overlapping bookings of one vehicle coexist)
+        self.__current_rentals: Dict[tuple, Dict] = {}
         self.__rental_history: List[Dict] = []
     
     def _validate_renter_id(self, renter_id: str) -> str:
@@ -106,9 +107,30 @@ class Renter(ABC):
         """Get the renter's contact information."""
         return self.__contact_info
     
+    def _current_rentals_map(self) -> Dict[tuple, Dict]:
+        """Get current rentals keyed by (vehicle_id, start_date, end_date),
+        migrating state unpickled from older data files."""
+        rentals = self.__current_rentals
+        if isinstance(rentals, list):
+            # Oldest format: a plain list of rental dicts
+            self.__current_rentals = {
+                (r['vehicle_id'], r['start_date'], r['end_date']): r for r in rentals}
+        elif rentals and not isinstance(next(iter(rentals)), tuple):
+            # Interim format keyed by vehicle_id alone
+            self.__current_rentals = {
+                (r['vehicle_id'], r['start_date'], r['end_date']): r for r in rentals.values()}
+        return self.__current_rentals
+
     def get_current_rentals(self) -> List[Dict]:
         """Get the list of current active rentals."""
-        return self.__current_rentals.copy()
+        return list(self._current_rentals_map().values())
+
+    def get_current_rental(self, vehicle_id: str) -> Optional[Dict]:
+        """Get a current rental of the vehicle, or None if not rented."""
+        for rental in self._current_rentals_map().values():
+            if rental['vehicle_id'] == vehicle_id:
+                return rental
+        return None
     
     def get_rental_history(self) -> List[Dict]:
         """Get the complete rental history."""
@@ -156,35 +178,35 @@ class Renter(ABC):
             'vehicle_id': vehicle_id,
             'start_date': rental_period.get_start_date(),
             'end_date': rental_period.get_end_date(),
+            # Parsed datetimes kept alongside the display strings so views
+            # can compare dates without re-parsing
+            'start_dt': rental_period.get_start_date_obj(),
+            'end_dt': rental_period.get_end_date_obj(),
             'duration': rental_period.calculate_duration(),
             'cost': rental_cost,
             'status': 'active'
         }
         
-        self.__current_rentals.append(rental_record)
+        key = (vehicle_id, rental_record['start_date'], rental_record['end_date'])
+        self._current_rentals_map()[key] = rental_record
         self.__rental_history.append(rental_record.copy())
     
     def complete_rental(self, vehicle_id: str, rental_period: RentalPeriod) -> bool:
         """Complete a rental (move from current to history)."""
-        for i, rental in enumerate(self.__current_rentals):
-            if (rental['vehicle_id'] == vehicle_id and 
-                rental['start_date'] == rental_period.get_start_date() and
-                rental['end_date'] == rental_period.get_end_date()):
-                
-                # Remove from current rentals
-                self.__current_rentals.pop(i)
-                
-                # Update status in history
-                for history_rental in self.__rental_history:
-                    if (history_rental['vehicle_id'] == vehicle_id and 
-                        history_rental['start_date'] == rental_period.get_start_date() and
-                        history_rental['end_date'] == rental_period.get_end_date() and
-                        history_rental['status'] == 'active'):
-                        history_rental['status'] = 'completed'
-                        break
-                
-                return True
-        
+        key = (vehicle_id, rental_period.get_start_date(), rental_period.get_end_date())
+        rental = self._current_rentals_map().pop(key, None)
+        if rental is not None:
+            # Update status in history
+            for history_rental in self.__rental_history:
+                if (history_rental['vehicle_id'] == vehicle_id and
+                    history_rental['start_date'] == rental_period.get_start_date() and
+                    history_rental['end_date'] == rental_period.get_end_date() and
+                    history_rental['status'] == 'active'):
+                    history_rental['status'] = 'completed'
+                    break
+
+            return True
+
         return False
     
     def get_total_spent(self) -> float:
@@ -38,9 +38,11 @@ class Vehicle(ABC):
         """
         self.__vehicle_id = self._validate_vehicle_id(vehicle_id)
         self.__make = self._validate_make(make)
+        self.__make_lower = self.__make.lower()  # cached for case-insensitive search
         self.__model = self._validate_model(model)
         self.__year = self._validate_year(year)
         self.__daily_rate = self._validate_daily_rate(daily_rate)
+        self.__price_bucket = self._compute_price_bucket(self.__daily_rate)
 
         # Cross-field validation
         self._validate_vehicle_year_vs_rate(self.__year, self.__daily_rate)
@@ -140,6 +142,17 @@ class Vehicle(ABC):
             raise InvalidVehicleDataError("daily_rate", str(daily_rate), 
                                         "daily rate too low even for older vehicles")
     
+    @staticmethod
+    def _compute_price_bucket(daily_rate: float) -> int:
+        """Map a daily rate to its search price bucket (-1 if between buckets)."""
+        if daily_rate <= 50:
+            return 0
+        if 51 <= daily_rate <= 100:
+            return 1
+        if daily_rate > 100:
+            return 2
+        return -1
+
     # Getter methods
     def get_vehicle_id(self) -> str:
         """Get the vehicle's unique identifier."""
@@ -148,7 +161,16 @@ class Vehicle(ABC):
     def get_make(self) -> str:
         """Get the vehicle's manufacturer."""
         return self.__make
-    
+
+    def get_make_lower(self) -> str:
+        """Get the lowercased manufacturer name (cached for search filters)."""
+        try:
+            return self.__make_lower
+        except AttributeError:
+            # Vehicles unpickled from older data files predate the cache
+            self.__make_lower = self.__make.lower()
+            return self.__make_lower
+
     def get_model(self) -> str:
         """Get the vehicle's model."""
         return self.__model
@@ -160,7 +182,16 @@ class Vehicle(ABC):
     def get_daily_rate(self) -> float:
         """Get the vehicle's daily rental rate."""
         return self.__daily_rate
-    
+
+    def get_price_bucket(self) -> int:
+        """Get the precomputed price bucket used by the search filters."""
+        try:
+            return self.__price_bucket
+        except AttributeError:
+            # Vehicles unpickled from older data files predate the bucket
+            self.__price_bucket = self._compute_price_bucket(self.__daily_rate)
+            return self.__price_bucket
+
     def get_rental_periods(self) -> List[Dict[str, Any]]:
         """Get all current rental periods for this vehicle."""
         return self.__rental_periods.copy()
@@ -177,6 +208,7 @@ class Vehicle(ABC):
     def set_make(self, make: str) -> None:
         """Set the vehicle's manufacturer."""
         self.__make = self._validate_make(make)
+        self.__make_lower = self.__make.lower()
     
     def set_model(self, model: str) -> None:
         """Set the vehicle's model."""
@@ -195,6 +227,7 @@ class Vehicle(ABC):
         # Cross-validate with existing year
         self._validate_vehicle_year_vs_rate(self.__year, validated_rate)
         self.__daily_rate = validated_rate
+        self.__price_bucket = self._compute_price_bucket(validated_rate)
 
     # Rental management methods
     def is_available(self, rental_period) -> bool:
@@ -8,7 +8,8 @@ data persistence using pickle, and support for multiple rentals per vehicle.
 
 import pickle
 import os
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from vehicle import Vehicle
 from car import Car
@@ -36,6 +37,11 @@ class VehicleRental:
     validation, error handling, and data persistence using pickle.
     """
     
+    # Authentication cache tuning: short TTL bounds staleness, the size cap
+    # bounds memory under credential-stuffing bursts
+    AUTH_CACHE_TTL = 5.0  # seconds
+    AUTH_CACHE_MAX = 1024
+
     def __init__(self, data_file: str = "vehicle_rental_data.pkl") -> None:
         """
         Initialize the VehicleRental system.
@@ -48,7 +54,31 @@ class VehicleRental:
         self.__rental_records: List[RentalRecord] = []
         self.__data_file = data_file
         self.__next_record_id = 1  # Counter for generating rental record IDs
-        
+        self.__dirty = False  # True while in-memory state has unsaved changes
+        self.__auth_cache: Dict[Tuple[str, str], Tuple[Optional[Renter], float]] = {}
+
+        # ID -> object indexes for O(1) lookups (kept in sync with the lists)
+        self.__vehicle_index: Dict[str, Vehicle] = {}
+        self.__renter_index: Dict[str, Renter] = {}
+
+        # renter ID -> rental records index, so per-user queries avoid
+        # scanning every record in the system
+        self.__records_by_renter: Dict[str, List[RentalRecord]] = {}
+        self.__records_by_renter_count = 0  # records covered by the index
+
+        # vehicle type -> vehicles bucket for the search filters
+        self.__vehicles_by_type: Dict[str, List[Vehicle]] = {}
+        self.__vehicles_by_type_count = 0  # vehicles covered by the bucket
+
+        # Active-record counter so dashboards avoid a full-records filter
+        self.__active_count = 0
+        self.__active_count_basis = 0  # records covered by the counter
+
+        # (renter ID, vehicle ID) -> completed rental records, oldest first,
+        # so invoice views avoid scanning a renter's full history
+        self.__completed_by_pair: Dict[Tuple[str, str], List[RentalRecord]] = {}
+        self.__completed_by_pair_count = 0  # records covered by the index
+
         # Load existing data on startup
         self.load_data()
     
@@ -70,8 +100,9 @@ class VehicleRental:
             }
 
             with open(self.__data_file, 'wb') as file:
-                pickle.dump(data, file)
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
 
+            self.__dirty = False
             print(f"Data successfully saved to {self.__data_file}")
 
         except (IOError, pickle.PickleError, OSError) as e:
@@ -110,6 +141,10 @@ class VehicleRental:
             else:
                 self.__rental_records = []
 
+            # Rebuild ID indexes for the freshly loaded lists
+            self.__vehicle_index = {v.get_vehicle_id(): v for v in self.__vehicles}
+            self.__renter_index = {r.get_renter_id(): r for r in self.__renters}
+
             # Load next record ID
             if 'next_record_id' in data:
                 self.__next_record_id = data['next_record_id']
@@ -126,21 +161,54 @@ class VehicleRental:
             self.__vehicles = []
             self.__renters = []
             self.__rental_records = []
+            self.__vehicle_index = {}
+            self.__renter_index = {}
             self.__next_record_id = 1
     
+    def _get_vehicle_index(self) -> Dict[str, Vehicle]:
+        """Get the vehicle ID index, rebuilding it if the list was mutated externally."""
+        if len(self.__vehicle_index) != len(self.__vehicles):
+            self.__vehicle_index = {v.get_vehicle_id(): v for v in self.__vehicles}
+        return self.__vehicle_index
+
+    def _get_renter_index(self) -> Dict[str, Renter]:
+        """Get the renter ID index, rebuilding it if the list was mutated externally."""
+        if len(self.__renter_index) != len(self.__renters):
+            self.__renter_index = {r.get_renter_id(): r for r in self.__renters}
+        return self.__renter_index
+
+    def _get_records_by_renter_index(self) -> Dict[str, List[RentalRecord]]:
+        """Get the per-renter record index, rebuilding it if records were mutated externally."""
+        if self.__records_by_renter_count != len(self.__rental_records):
+            index: Dict[str, List[RentalRecord]] = {}
+            for record in self.__rental_records:
+                index.setdefault(record.get_renter_id(), []).append(record)
+            self.__records_by_renter = index
+            self.__records_by_renter_count = len(self.__rental_records)
+        return self.__records_by_renter
+
+    def _get_completed_by_pair_index(self) -> Dict[Tuple[str, str], List[RentalRecord]]:
+        """Get the (renter, vehicle) completed-records index, rebuilding it if stale."""
+        if self.__completed_by_pair_count != len(self.__rental_records):
+            index: Dict[Tuple[str, str], List[RentalRecord]] = {}
+            for record in self.__rental_records:
+                if record.is_completed():
+                    index.setdefault((record.get_renter_id(), record.get_vehicle_id()), []).append(record)
+            self.__completed_by_pair = index
+            self.__completed_by_pair_count = len(self.__rental_records)
+        return self.__completed_by_pair
+
+    def get_completed_rentals(self, renter_id: str, vehicle_id: str) -> List[RentalRecord]:
+        """Get the completed rental records for a renter/vehicle pair, oldest first."""
+        return self._get_completed_by_pair_index().get((renter_id, vehicle_id), []).copy()
+
     def _find_vehicle_by_id(self, vehicle_id: str) -> Optional[Vehicle]:
-        """Find a vehicle by its ID."""
-        for vehicle in self.__vehicles:
-            if vehicle.get_vehicle_id() == vehicle_id:
-                return vehicle
-        return None
-    
+        """Find a vehicle by its ID (O(1) dict lookup)."""
+        return self._get_vehicle_index().get(vehicle_id)
+
     def _find_renter_by_id(self, renter_id: str) -> Optional[Renter]:
-        """Find a renter by their ID."""
-        for renter in self.__renters:
-            if renter.get_renter_id() == renter_id:
-                return renter
-        return None
+        """Find a renter by their ID (O(1) dict lookup)."""
+        return self._get_renter_index().get(renter_id)
     
     def add_vehicles(self, vehicle: Vehicle) -> None:
         """
@@ -160,6 +228,7 @@ class VehicleRental:
         if self._find_vehicle_by_id(vehicle_id) is not None:
             raise DuplicateVehicleError(vehicle_id)
         
+        self._get_vehicle_index()[vehicle_id] = vehicle
         self.__vehicles.append(vehicle)
         print(f"Vehicle {vehicle_id} ({vehicle.get_vehicle_type()}) added to the system.")
         
@@ -187,6 +256,7 @@ class VehicleRental:
         if self._find_renter_by_id(renter_id) is not None:
             raise DuplicateRenterError(renter_id)
         
+        self._get_renter_index()[renter_id] = renter
         self.__renters.append(renter)
         print(f"{renter.get_user_type()} user {renter.get_name()} (ID: {renter_id}) added to the system.")
         
@@ -399,6 +469,12 @@ class VehicleRental:
 
             # Update rental record
             active_record.process_return(return_date, final_cost, return_type)
+            self.__active_count = max(0, self.__active_count - 1)
+
+            # Index the completed record for (renter, vehicle) invoice lookups
+            completed = self._get_completed_by_pair_index().setdefault((renter_id, vehicle_id), [])
+            if active_record not in completed:
+                completed.append(active_record)
 
             # Auto-save
             try:
@@ -536,6 +612,16 @@ class VehicleRental:
     def get_vehicles(self) -> List[Vehicle]:
         """Get a copy of the vehicles list."""
         return self.__vehicles.copy()
+
+    def get_vehicles_by_type(self, vehicle_type: str) -> List[Vehicle]:
+        """Get the vehicles of a given type (pre-bucketed, O(1) bucket lookup)."""
+        if self.__vehicles_by_type_count != len(self.__vehicles):
+            buckets: Dict[str, List[Vehicle]] = {}
+            for vehicle in self.__vehicles:
+                buckets.setdefault(vehicle.get_vehicle_type(), []).append(vehicle)
+            self.__vehicles_by_type = buckets
+            self.__vehicles_by_type_count = len(self.__vehicles)
+        return self.__vehicles_by_type.get(vehicle_type, []).copy()
     
     def get_renters(self) -> List[Renter]:
         """Get a copy of the renters list."""
@@ -544,6 +630,31 @@ class VehicleRental:
     def get_rental_records(self) -> List[RentalRecord]:
         """Get a copy of all rental records."""
         return self.__rental_records.copy()
+
+    def get_rental_table_rows(self) -> List[dict]:
+        """
+        Build plain display rows for rental listings, newest first.
+
+        Precomputing the row dicts here keeps per-cell getter dispatch out
+        of the template loop when rendering large histories.
+        """
+        rows = []
+        for record in reversed(self.__rental_records):
+            actual_return = record.get_actual_return_date()
+            rows.append({
+                'record_id': record.get_record_id(),
+                'vehicle_id': record.get_vehicle_id(),
+                'renter_id': record.get_renter_id(),
+                'start_date': record.get_start_date(),
+                'end_date': record.get_end_date(),
+                'actual_return_date': actual_return,
+                'days': record.calculate_actual_duration() if actual_return else record.calculate_duration(),
+                'rental_cost': record.get_rental_cost(),
+                'final_cost': record.get_final_cost(),
+                'status': record.get_status(),
+                'return_type': record.get_return_type(),
+            })
+        return rows
     
     def add_rental_record(self, vehicle_id: str, renter_id: str, start_date: str, 
                          end_date: str, rental_cost: float, discount_applied: float = 0.0) -> RentalRecord:
@@ -575,6 +686,10 @@ class VehicleRental:
             discount_applied=discount_applied
         )
         
+        self._get_records_by_renter_index().setdefault(renter_id, []).append(rental_record)
+        self.__records_by_renter_count += 1
+        self.__active_count += 1  # new records start in 'active' status
+        self.__active_count_basis += 1
         self.__rental_records.append(rental_record)
         return rental_record
     
@@ -584,11 +699,27 @@ class VehicleRental:
     
     def get_rental_records_by_renter(self, renter_id: str) -> List[RentalRecord]:
         """Get all rental records for a specific renter."""
-        return [r for r in self.__rental_records if r.get_renter_id() == renter_id]
+        return self._get_records_by_renter_index().get(renter_id, []).copy()
+
+    def get_active_rental_records_by_renter(self, renter_id: str) -> List[RentalRecord]:
+        """Get the currently active rental records for a specific renter."""
+        return [r for r in self._get_records_by_renter_index().get(renter_id, []) if r.is_active()]
     
     def get_active_rental_records(self) -> List[RentalRecord]:
         """Get all currently active rental records."""
         return [r for r in self.__rental_records if r.is_active()]
+
+    def _get_active_count(self) -> int:
+        """Get the active-record count, recounting if records were mutated externally."""
+        if self.__active_count_basis != len(self.__rental_records):
+            self.__active_count = sum(1 for r in self.__rental_records if r.is_active())
+            self.__active_count_basis = len(self.__rental_records)
+        return self.__active_count
+
+    def get_counts(self) -> Tuple[int, int, int, int]:
+        """Get (vehicle, renter, record, active record) counts without copying lists."""
+        return (len(self.__vehicles), len(self.__renters),
+                len(self.__rental_records), self._get_active_count())
     
     def find_rental_record_by_id(self, record_id: str) -> Optional[RentalRecord]:
         """Find a rental record by its ID."""
@@ -608,11 +739,35 @@ class VehicleRental:
         Returns:
             Optional[Renter]: The authenticated user object if successful, None otherwise
         """
+        # Short-TTL cache covering both successful and failed attempts, so
+        # repeated identical logins (including brute-force retries) skip the
+        # lookup + password check
+        key = (renter_id, password)
+        now = time.monotonic()
+        cached = self.__auth_cache.get(key)
+        if cached is not None and now - cached[1] < self.AUTH_CACHE_TTL:
+            return cached[0]
+
         renter = self._find_renter_by_id(renter_id)
-        if renter and renter.verify_password(password):
-            return renter
-        return None
+        result = renter if renter is not None and renter.verify_password(password) else None
+
+        if len(self.__auth_cache) >= self.AUTH_CACHE_MAX:
+            self.__auth_cache.clear()
+        self.__auth_cache[key] = (result, now)
+        return result
     
+    def mark_dirty(self) -> None:
+        """Flag the in-memory state as modified and needing a save."""
+        self.__dirty = True
+
+    def flush(self) -> None:
+        """Save to disk only if there are unsaved changes."""
+        if self.__dirty:
+            try:
+                self.save_data()
+            except DataPersistenceError as e:
+                print(f"Warning: Could not flush data: {e}")
+
     def cleanup_and_exit(self) -> None:
         """Perform cleanup operations and save data before exiting."""
         try: